@@ -1,4 +1,4 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from dotenv import load_dotenv
 import os
@@ -6,6 +6,7 @@ import os
 from app.utils import create_simple_logger
 from app.routes import sessions, artifacts, uploads, chat
 from app.models.response_models import HealthResponse
+from app.services.storage import session_cache_scope
 
 
 load_dotenv()
@@ -31,6 +32,14 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+
+@app.middleware("http")
+async def session_cache_middleware(request: Request, call_next):
+    """Fetch each session from Redis at most once per request."""
+    with session_cache_scope():
+        return await call_next(request)
+
+
 # app.include_router(root.router)
 app.include_router(sessions.router)
 app.include_router(artifacts.router)
@@ -1,10 +1,37 @@
 """Models for various objects used in the application."""
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 from typing import List, Optional, Any, Union, Dict, Literal
 from datetime import datetime
+import os
+import time
 import uuid
 
+try:
+    # Rust UUID generator with native UUIDv7
+    import uuid_utils  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency
+    uuid_utils = None
+
+
+def uuid7() -> str:
+    """Generate a UUIDv7 string: a millisecond timestamp then random bits.
+
+    IDs made in later milliseconds sort after earlier ones, as strings too.
+    """
+    if uuid_utils is not None:
+        return str(uuid_utils.uuid7())
+    ms = time.time_ns() // 1_000_000 & ((1 << 48) - 1)
+    rand = int.from_bytes(os.urandom(10), "big")
+    value = (
+        ms << 80
+        | 0x7 << 76  # version
+        | (rand >> 68) << 64  # 12 random bits
+        | 0b10 << 62  # RFC 4122 variant
+        | rand & ((1 << 62) - 1)
+    )
+    return str(uuid.UUID(int=value))
+
 
 def generate_random_id() -> str:
     """Generate a random ID."""
@@ -12,9 +39,8 @@ def generate_random_id() -> str:
 
 
 def generate_random_id_and_add_prefix(prefix: str) -> str:
-    """Generate a random ID with a given prefix."""
-    id_ = str(uuid.uuid4())
-    return f"{prefix}_{id_}"
+    """Generate a time-ordered ID with a given prefix."""
+    return f"{prefix}_{uuid7()}"
 
 
 different_ids_factory = {
@@ -149,11 +175,26 @@ class Session(BaseModel):
         default_factory=list, description="List of messages in the chat session"
     )
     numMessages: int = Field(0, description="Number of messages in the session")
+    numArtifacts: int = Field(0, description="Number of artifacts in the session")
 
     sessionType: Literal["chat", "image", "data_analysis"] = Field(
         "chat", description="Type of the session"
     )
 
+    # SessionInfo fields as last written to the user's session index
+    _indexed_info: Optional[tuple] = PrivateAttr(default=None)
+
+    def index_fingerprint(self) -> tuple:
+        """The fields that make up this session's SessionInfo."""
+        return (
+            self.userId,
+            self.createdAt,
+            self.updatedAt,
+            self.title,
+            self.numMessages,
+            self.numArtifacts,
+        )
+
     def __repr__(self) -> str:
         return f"<Session id={self.sessionId} userId={self.userId} title={self.title} numMessages={len(self.messages)}>"
 
@@ -5,6 +5,7 @@ These endpoints handle chat message creation, LLM responses, and artifact manage
 following the workflow described in storage_options_temp.md.
 """
 
+import asyncio
 from fastapi import APIRouter, HTTPException, Form
 from typing import Optional, List, Union
 
@@ -89,6 +90,8 @@ async def send_message(
     - If a CSV artifact ID is provided, it's a data analysis request.
     """
     artifact_ids = artifact_ids.split(",") if artifact_ids else []
+    # Refreshes nothing unless user_id owns the session (checked in the script)
+    await asyncio.to_thread(redis_cache.extend_session_ttl, session_id, user_id)
     arts = redis_cache.get_file_artifact_ids_for_session(session_id)
     artifacts_from_session = set(arts or [])
     artifact_ids_final = []
@@ -1,13 +1,20 @@
-from typing import Optional
+from typing import List, Optional, Tuple
 from fastapi import APIRouter, UploadFile, File, Form, HTTPException
-import base64
+import asyncio
 import io
 import pandas as pd
+import pyarrow as pa
 from PIL import Image
 
 from app.models.response_models import CSVUploadResponse, ImageUploadResponse
 from app.models.object_models import CSVArtifact, ImageArtifact
-from app.services.storage import redis_cache, DataFrameHandler, ImageHandler
+from app.services.storage import (
+    redis_cache,
+    DataFrameHandler,
+    ImageHandler,
+    make_thumbnail,
+    read_csv_to_table,
+)
 from app.utils import create_simple_logger
 
 logger = create_simple_logger(__name__)
@@ -17,9 +24,32 @@ router = APIRouter(prefix="/upload", tags=["uploads"])
 
 def create_thumbnail(image: Image.Image, size=(128, 128)) -> Image.Image:
     """Create a thumbnail of the given image."""
-    img_copy = image.copy()
-    img_copy.thumbnail(size)
-    return img_copy
+    return make_thumbnail(image, size)
+
+
+def parse_and_encode_csv(
+    content: bytes, encoding: str, delimiter: str, header: bool
+) -> Tuple[Tuple[int, int], List[str], str]:
+    """Parse uploaded CSV bytes and return its shape, columns and artifact payload.
+
+    Arrow's multithreaded reader is used when it can handle the input; the
+    table is written to parquet without ever building a pandas frame.
+    """
+    try:
+        table = read_csv_to_table(
+            content, encoding=encoding, delimiter=delimiter, header=header
+        )
+        shape, columns, frame = table.shape, table.column_names, table
+    except (pa.ArrowInvalid, ValueError) as e:
+        # e.g. multi-character delimiters, which only pandas supports
+        logger.debug(f"Falling back to pandas CSV parsing: {e}")
+        df = pd.read_csv(
+            io.StringIO(content.decode(encoding)),
+            delimiter=delimiter,
+            header=0 if header else None,
+        )
+        shape, columns, frame = df.shape, [str(c) for c in df.columns], df
+    return shape, columns, DataFrameHandler(frame).get_base64_representation()
 
 
 @router.post("/csv", response_model=CSVUploadResponse)
@@ -53,21 +83,18 @@ async def upload_csv(
 
     try:
         content = await file.read()
-        df = pd.read_csv(
-            io.StringIO(content.decode(encoding)),
-            delimiter=delimiter,
-            header=0 if header else None,
+        # Parsing and compressing are CPU bound; run them off the event loop
+        shape, columns, csv_data = await asyncio.to_thread(
+            parse_and_encode_csv, content, encoding, delimiter, header
         )
-        file_handler = DataFrameHandler(df)
-        csv_data = file_handler.get_base64_representation()
         # Create CSV artifact object
         csv_artifact = CSVArtifact(
             data=csv_data,
             type="csv",
-            description=description or f"CSV file with shape {df.shape}",
-            num_rows=df.shape[0],
-            num_columns=df.shape[1],
-            columns=list(df.columns),
+            description=description or f"CSV file with shape {shape}",
+            num_rows=shape[0],
+            num_columns=shape[1],
+            columns=columns,
         )
 
         # Save artifact to Redis
@@ -87,16 +114,16 @@ async def upload_csv(
         response = CSVUploadResponse(
             data=csv_data,
             type="csv",
-            description=description or f"CSV file with shape {df.shape}",
-            num_rows=df.shape[0],
-            num_columns=df.shape[1],
+            description=description or f"CSV file with shape {shape}",
+            num_rows=shape[0],
+            num_columns=shape[1],
             artifactId=csv_artifact.artifactId,
         )
 
         # Add columns information to the response
-        response.columns = list(df.columns)
+        response.columns = columns
         logger.info(
-            f"Uploaded CSV with shape: {df.shape}, artifactId: {response.artifactId}, sessionId: {sessionId}"
+            f"Uploaded CSV with shape: {shape}, artifactId: {response.artifactId}, sessionId: {sessionId}"
         )
         return response
     except Exception as e:
@@ -128,15 +155,11 @@ async def upload_image(
 
     try:
         content = await file.read()
-        image = Image.open(io.BytesIO(content))
-        buffered = io.BytesIO()
-        image.save(buffered, format=image.format)
-        img_data = base64.b64encode(buffered.getvalue()).decode("utf-8")
-
-        thumbnail = create_thumbnail(image)
-        thumb_buffered = io.BytesIO()
-        thumbnail.save(thumb_buffered, format=image.format)
-        thumb_data = base64.b64encode(thumb_buffered.getvalue()).decode("utf-8")
+        handler = ImageHandler(data=content, encoding=None)
+        image = handler.get_python_friendly_format()
+        # Same format as the upload, so the original bytes are stored as-is
+        handler.image_format = image.format
+        img_data, thumb_data = handler.get_full_and_thumbnail()
 
         # Create Image artifact object
         image_artifact = ImageArtifact(
@@ -38,7 +38,7 @@ def simple_question_answer(
                 fig.savefig(buf, format="png")
                 plt.close(fig)
                 buf.seek(0)
-                b64 = base64.b64encode(buf.read()).decode("utf-8")
+                b64 = base64.b64encode(buf.read()).decode("ascii")
                 artifact["chart"] = f"data:image/png;base64,{b64}"
                 answer = f"Generated histogram for column '{col}' (see artifact.chart)."
     else:
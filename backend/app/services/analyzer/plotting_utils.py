@@ -83,7 +83,7 @@ def mpl_fig_to_data_uri(
     raw = buf.read()
     raw_len = len(raw)
     logger.debug("mpl_fig_to_base64: Raw image bytes length=%d", raw_len)
-    b64: str = base64.b64encode(raw).decode("utf-8")
+    b64: str = base64.b64encode(raw).decode("ascii")
     buf.close()
     logger.info(
         "mpl_fig_to_base64: Encoded figure id=%s to base64 (chars=%d, fmt=%s)",
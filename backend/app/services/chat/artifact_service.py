@@ -10,7 +10,6 @@ import pandas as pd
 from PIL import Image
 from typing import List, Optional, Union, Dict
 from datetime import datetime
-from pydantic import TypeAdapter
 
 from app.models.object_models import (
     Artifact,
@@ -47,7 +46,7 @@ class ArtifactService:
         session_id: str,
         user_id: str,
         description: Optional[str] = None,
-        compression: Optional[str] = "gzip",
+        compression: Optional[str] = "zstd",
     ) -> Optional[CSVArtifact]:
         """
         Create a CSV artifact from DataFrame or CSV data.
@@ -405,35 +404,18 @@ class ArtifactService:
                 )
                 return []
 
-            # Get artifact IDs for the message
-            artifact_ids = self.cache.get_artifact_ids_for_message(
-                message_id, session_id
-            )
-
+            # Ownership is already validated above, so read the index directly
+            artifact_ids = [
+                aid
+                for aid in self.cache.get_artifact_ids_for_message(message_id) or []
+                if aid
+            ]
             if not artifact_ids:
                 return []
 
-            # Fetch all artifacts
-            artifacts = []
-            raw_artifacts = self.cache.redis.mget(artifact_ids)
-            for i, raw_artifact in enumerate(raw_artifacts):
-                if raw_artifact is None:
-                    logger.warning(f"Artifact {artifact_ids[i]} not found in Redis")
-                    continue
-
-                try:
-                    # Decode if bytes
-                    if isinstance(raw_artifact, bytes):
-                        raw_artifact = raw_artifact.decode("utf-8")
-
-                    artifact = TypeAdapter(Artifact).validate_json(raw_artifact)
-                    artifacts.append(artifact)
-
-                except Exception as e:
-                    logger.error(
-                        f"Failed to parse artifact {artifact_ids[i]}: {str(e)}"
-                    )
-                continue
+            # Fetch all artifacts in one round trip, keeping index order
+            found = self.cache.get_artifacts(artifact_ids)
+            artifacts = [found[aid] for aid in artifact_ids if aid in found]
 
             logger.debug(
                 f"Retrieved {len(artifacts)} artifacts for message {message_id}"
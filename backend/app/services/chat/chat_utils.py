@@ -171,8 +171,7 @@ def create_image_artifact(
     """
     image_handler = ImageHandler(data=image)
     pil_image = image_handler.get_python_friendly_format()
-    thubmnail = image_handler.get_thumbnail_base64()
-    base_64_str = image_handler.get_base64_representation()
+    base_64_str, thubmnail = image_handler.get_full_and_thumbnail()
     image_artifact = ImageArtifact(
         type="image",
         data=base_64_str,
@@ -196,10 +195,9 @@ def create_csv_artifact(df: Union[pd.DataFrame, str, bytes], **kwargs) -> CSVArt
         CSVArtifact: The created CSVArtifact object.
     """
     df_handler = DataFrameHandler(data=df)
-    pandas_df = df_handler.get_python_friendly_format()
     csv_data = df_handler.get_base64_representation()
-    num_rows, num_columns = pandas_df.shape
-    columns = list(pandas_df.columns)
+    num_rows, num_columns = df_handler.shape
+    columns = df_handler.columns
 
     csv_artifact = CSVArtifact(
         type="csv",
@@ -5,7 +5,7 @@ This service implements the message creation workflow described in storage_optio
 1. Create message with artifacts if required
 2. Store message in Redis cache
 3. Add message ID to session's message index
-4. Update session's last updated time
+4. Update session's last updated time and message counter (HINCRBY)
 """
 
 from typing import List, Optional, Dict
@@ -13,7 +13,6 @@ from datetime import datetime
 from pydantic import TypeAdapter
 
 from app.models.object_models import Message, Artifact, Session
-from app.services.chat.artifact_service import artifact_service
 from app.services.storage.redis_cache import RedisCache, redis_cache
 from app.utils import create_simple_logger
 
@@ -61,19 +60,21 @@ class MessageService:
             # Save message with cascade to handle artifacts
             self.cache.save_message(message, cascade=push_artifacts_in_message)
 
+            # Only artifacts that were saved and indexed count towards the session
+            num_indexed = 0
             if not message.artifacts and artifacts:
                 # Save each artifact individually and link to message
                 for artifact in artifacts:
                     logger.debug(
                         f"Saving artifact {artifact.artifactId} for message {message.messageId}"
                     )
-                    self.cache.save_artifact(artifact)
-                    self.cache._add_artifact_to_message_index(
-                        message.messageId, artifact.artifactId
+                    num_indexed += self.cache.save_artifact_with_index(
+                        artifact, message.messageId
                     )
-
+            elif message.artifacts and push_artifacts_in_message:
+                num_indexed = len(message.artifacts)
             # Update session's last updated time and message count
-            await self._update_session_after_message(session, message.messageId)
+            await self._update_session_after_message(session, message, num_indexed)
             logger.info(
                 f"Created {role} message {message.messageId} in session {session_id}"
             )
@@ -200,11 +201,14 @@ class MessageService:
                 logger.warning(f"Message {message_id} not found or access denied")
                 return False
 
-            # Save the artifact
-            self.cache.save_artifact(artifact)
-
-            # Add artifact to message index
-            self.cache._add_artifact_to_message_index(message_id, artifact.artifactId)
+            # Save the artifact and add it to the message index; one already
+            # indexed is only re-saved, not counted again
+            if self.cache.save_artifact_with_index(artifact, message_id):
+                session = self.cache.get_session(session_id, user_id=user_id)
+                if session:
+                    self.cache.record_message_in_session(
+                        session, 0, artifacts_delta=1
+                    )
 
             logger.info(f"Added artifact {artifact.artifactId} to message {message_id}")
             return True
@@ -214,64 +218,36 @@ class MessageService:
             return False
 
     async def _update_session_after_message(
-        self, session: Session, message_id: str
+        self, session: Session, message: Message, num_artifacts: int = 0
     ) -> None:
         """
         Update session metadata after adding a message.
 
         Args:
             session: The session object to update
-            message_id: The ID of the message that was added
+            message: The message that was added
+            num_artifacts: Number of artifacts saved with the message
         """
         try:
-            # Get the message that was just added
-            message = self.cache.get_message(message_id, session_id=session.sessionId)
-            if message is None:
-                logger.warning(
-                    f"Could not find message {message_id} after adding to session {session.sessionId}"
-                )
-                return
-
-            # Update session's last updated time
-            session.updatedAt = datetime.now()
-
-            # Update message count
-            message_ids = self.cache.get_message_ids_for_session(session.sessionId)
-            session.numMessages = len(message_ids) if message_ids else 0
+            fields = {"updatedAt": datetime.now()}
 
-            # Check if this is the first user message and update title accordingly
+            # The first user message names an untitled session
             if message.role == "user" and session.title is None:
-                # Check if this is the first user message by looking at all messages
-                all_messages = []
-                if message_ids:
-                    for mid in message_ids:
-                        msg = self.cache.get_message(mid, session_id=session.sessionId)
-                        if msg:
-                            all_messages.append(msg)
-
-                # Check if there are any previous user messages
-                previous_user_messages = [
-                    msg
-                    for msg in all_messages
-                    if msg.role == "user" and msg.messageId != message_id
-                ]
-
-                if len(previous_user_messages) == 0:
-                    # This is the first user message, update the title
-                    # Truncate to a reasonable length for the title
-                    title_content = message.content.strip()
-                    if len(title_content) > 50:
-                        title_content = title_content[:47] + "..."
-                    session.title = title_content
-                    logger.info(
-                        f"Updated session {session.sessionId} title to first user message: {session.title}"
-                    )
+                # Truncate to a reasonable length for the title
+                title_content = message.content.strip()
+                if len(title_content) > 50:
+                    title_content = title_content[:47] + "..."
+                fields["title"] = title_content
+                logger.info(
+                    f"Updated session {session.sessionId} title to first user message: {title_content}"
+                )
 
-            # Save updated session (without cascade to avoid infinite loop)
-            self.cache.save_session(session, cascade=False)
+            self.cache.record_message_in_session(
+                session, 1, artifacts_delta=num_artifacts, **fields
+            )
 
             logger.debug(
-                f"Updated session {session.sessionId} after adding message {message_id}"
+                f"Updated session {session.sessionId} after adding message {message.messageId}"
             )
 
         except Exception as e:
@@ -292,6 +268,9 @@ class MessageService:
             True if successful, False otherwise
         """
         try:
+            num_artifacts = len(
+                self.cache.get_artifact_ids_for_message(message_id) or []
+            )
             # Delete with full ownership validation and cascade
             deleted_count = self.cache.delete_message_with_ownership(
                 message_id, session_id, user_id, cascade=True
@@ -304,7 +283,12 @@ class MessageService:
             # Update session after message deletion
             session = self.cache.get_session(session_id, user_id=user_id)
             if session:
-                await self._update_session_after_message(session, message_id)
+                self.cache.record_message_in_session(
+                    session,
+                    -1,
+                    artifacts_delta=-num_artifacts,
+                    updatedAt=datetime.now(),
+                )
 
             logger.info(f"Deleted message {message_id} with {deleted_count} Redis keys")
             return True
@@ -328,19 +312,10 @@ class MessageService:
             Message with artifacts loaded, or None if not found/unauthorized
         """
         try:
-            # Get message with ownership validation
-            message = self.cache.get_message_with_full_ownership(
+            # Ownership chain, message and artifacts in two round trips
+            return self.cache.get_message_with_artifacts(
                 message_id, session_id, user_id
             )
-            if message is None:
-                return None
-
-            artifacts = artifact_service.get_artifacts_for_message(
-                message_id=message_id, session_id=session_id, user_id=user_id
-            )
-            message.artifacts = []
-
-            return message
 
         except Exception as e:
             logger.error(f"Failed to get message {message_id} with artifacts: {str(e)}")
@@ -6,8 +6,8 @@ to minimize Redis round-trips when fetching complete session data.
 """
 
 from typing import Dict, List, Optional, Set
+import asyncio
 import json
-from pydantic import TypeAdapter
 import pandas as pd
 
 from app.models.object_models import Session, Message, Artifact, SessionInfo
@@ -78,10 +78,9 @@ class SessionService:
                 )
                 return None
 
-            # Step 2: Get all message IDs for the session
-            message_ids = self.cache.get_message_ids_for_session(
-                session_id, user_id=user_id
-            )
+            # Step 2: Get all message IDs for the session (ownership was just
+            # checked, so skip the second check inside the index read)
+            message_ids = self.cache.get_message_ids_for_session(session_id)
             if not message_ids:
                 logger.info(f"No messages found for session {session_id}")
                 # Return session with empty messages list
@@ -141,40 +140,10 @@ class SessionService:
         if not message_ids:
             return []
 
-        # Prepare message keys for MGET
-        message_keys = [self.cache.k_message(msg_id) for msg_id in message_ids]
-
         try:
-            # Execute single MGET command
-            raw_messages = self.cache.redis.mget(message_keys)
-
-            # Process results and filter out nulls
-            messages = []
-            for i, raw_msg in enumerate(raw_messages):
-                if raw_msg is None:
-                    logger.warning(f"Message {message_ids[i]} not found in Redis")
-                    continue
-
-                try:
-                    # Decode if bytes
-                    if isinstance(raw_msg, bytes):
-                        raw_msg = raw_msg.decode("utf-8")
-
-                    message = Message.model_validate_json(raw_msg)
-
-                    # Validate session ownership
-                    if message.sessionId != session_id:
-                        logger.warning(
-                            f"Message {message.messageId} belongs to session {message.sessionId}, not {session_id}"
-                        )
-                        continue
-
-                    messages.append(message)
-
-                except Exception as e:
-                    logger.error(f"Failed to parse message {message_ids[i]}: {str(e)}")
-                    continue
-
+            # Single MGET; ownership is checked against session_id
+            fetched = self.cache.get_messages(message_ids, session_id=session_id)
+            messages = [m for m in fetched if m is not None]
             logger.debug(
                 f"Successfully fetched {len(messages)}/{len(message_ids)} messages for session {session_id}"
             )
@@ -200,15 +169,13 @@ class SessionService:
             return []
 
         # Step 1: Collect all unique artifact IDs from all messages
+        # Every message's artifact index is read in one pipeline
+        message_to_artifact_ids = self.cache.get_artifact_ids_for_messages(
+            [message.messageId for message in messages]
+        )
         all_artifact_ids: Set[str] = set()
-        message_to_artifact_ids: Dict[str, List[str]] = {}
-
-        for message in messages:
-            # Get artifact IDs for this message from the index
-            artifact_ids = self.cache.get_artifact_ids_for_message(message.messageId)
-            if artifact_ids:
-                message_to_artifact_ids[message.messageId] = artifact_ids
-                all_artifact_ids.update(artifact_ids)
+        for artifact_ids in message_to_artifact_ids.values():
+            all_artifact_ids.update(artifact_ids)
 
         if not all_artifact_ids:
             logger.debug("No artifacts found for any messages")
@@ -253,34 +220,13 @@ class SessionService:
         if not artifact_ids:
             return {}
 
-        # Prepare artifact keys for MGET
-        artifact_keys = [self.cache.k_artifact(art_id) for art_id in artifact_ids]
-
         try:
-            # Execute single MGET command
-            raw_artifacts = self.cache.redis.mget(artifact_keys)
-
-            # Process results into lookup dictionary
-            artifact_lookup: Dict[str, Artifact] = {}
-            for i, raw_artifact in enumerate(raw_artifacts):
-                if raw_artifact is None:
-                    logger.warning(f"Artifact {artifact_ids[i]} not found in Redis")
-                    continue
-
-                try:
-                    # Decode if bytes
-                    if isinstance(raw_artifact, bytes):
-                        raw_artifact = raw_artifact.decode("utf-8")
-
-                    artifact = TypeAdapter(Artifact).validate_json(raw_artifact)
-                    artifact_lookup[artifact_ids[i]] = artifact
-
-                except Exception as e:
-                    logger.error(
-                        f"Failed to parse artifact {artifact_ids[i]}: {str(e)}"
-                    )
-                    continue
-
+            # Single MGET, plus one pipeline if any payload was stored in parts.
+            # Artifact payloads can be megabytes to read, inflate and parse, so
+            # this runs on a worker thread (the connection pool is thread-safe)
+            artifact_lookup = await asyncio.to_thread(
+                self.cache.get_artifacts, artifact_ids
+            )
             logger.debug(
                 f"Successfully fetched {len(artifact_lookup)}/{len(artifact_ids)} artifacts"
             )
@@ -304,32 +250,7 @@ class SessionService:
             SessionInfo object or None if not found/unauthorized
         """
         try:
-            session = self.cache.get_session(session_id, user_id=user_id)
-            if session is None:
-                return None
-
-            # Calculate artifact count by checking all messages
-            message_ids = self.cache.get_message_ids_for_session(
-                session_id, user_id=user_id
-            )
-            total_artifacts = 0
-
-            if message_ids:
-                for msg_id in message_ids:
-                    artifact_ids = self.cache.get_artifact_ids_for_message(msg_id)
-                    if artifact_ids:
-                        total_artifacts += len(artifact_ids)
-
-            return SessionInfo(
-                sessionId=session.sessionId,
-                userId=session.userId,
-                createdAt=session.createdAt,
-                updatedAt=session.updatedAt,
-                title=session.title,
-                numMessages=len(message_ids) if message_ids else 0,
-                numArtifacts=total_artifacts,
-            )
-
+            return self.cache.get_session_info(session_id, user_id=user_id)
         except Exception as e:
             logger.error(f"Error getting session summary {session_id}: {str(e)}")
             return None
@@ -382,24 +303,22 @@ class SessionService:
                 logger.info(f"No messages found for session {session_id}")
                 return None
 
-            artifact_ids = [
-                self.cache.get_artifact_ids_for_message(msg_id)
-                for msg_id in message_ids
-            ]
-            artifact_ids = [ids for ids in artifact_ids if ids]
-            artifact_ids = [id for sublist in artifact_ids for id in sublist]
+            index = self.cache.get_artifact_ids_for_messages(message_ids)
+            artifact_ids = [aid for mid in message_ids for aid in index.get(mid, [])]
 
             if not artifact_ids:
                 logger.info(f"No artifacts found in session {session_id}")
                 return None
 
-            all_artifacts = self._batch_fetch_artifacts(artifact_ids)
+            all_artifacts = await self._batch_fetch_artifacts(artifact_ids)
             if not all_artifacts:
                 logger.info(f"No artifacts found in session {session_id}")
                 return None
 
             df_artifacts = [
-                art for art in all_artifacts if art and art["type"] == "csv"
+                all_artifacts[aid]
+                for aid in artifact_ids
+                if aid in all_artifacts and all_artifacts[aid].type == "csv"
             ]
             if not df_artifacts:
                 logger.info(f"No CSV artifacts found in session {session_id}")
@@ -407,8 +326,12 @@ class SessionService:
 
             # Assume the latest CSV artifact is the relevant DataFrame
             latest_artifact = df_artifacts[-1]
-            df_handler = DataFrameHandler(latest_artifact["data"])
-            return df_handler.get_python_friendly_format()
+            # Decoding a large artifact is CPU bound; keep it off the event loop
+            return await asyncio.to_thread(
+                lambda: DataFrameHandler(
+                    latest_artifact.data
+                ).get_python_friendly_format()
+            )
 
         except Exception as e:
             logger.error(
@@ -1,4 +1,5 @@
 from litellm import acompletion
+import asyncio
 from typing import List, Any, AsyncGenerator, Dict, Optional, Union
 import os
 from dotenv import load_dotenv
@@ -266,8 +267,10 @@ async def analyze_data(
     else:
         push_df_artifact = True
 
-    df_handler = DataFrameHandler(df_artifact.data)
-    df = df_handler.get_python_friendly_format()
+    # Decoding a large artifact is CPU bound; keep it off the event loop
+    df = await asyncio.to_thread(
+        lambda: DataFrameHandler(df_artifact.data).get_python_friendly_format()
+    )
     system_prompt = Prompts.format_system_prompt_for_analyzer(df)
     current_message = Message(
         sessionId=session_id,
@@ -1,3 +1,3 @@
-from .redis_cache import RedisCache, redis_cache
+from .redis_cache import RedisCache, redis_cache, session_cache_scope
 from .files_handler import *
 from .storage import *
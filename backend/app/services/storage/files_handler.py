@@ -1,23 +1,128 @@
 """Utility functions for handling file and image data encoding, compression, and conversion to/from pandas DataFrames."""
 
 import io
+import os
 import base64
 import gzip
+import zlib
 import pandas as pd
-from typing import Optional, Union
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+import pyarrow.feather as feather
+import pyarrow.parquet as pq
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+import PIL
 from PIL import Image
 
 from app.utils import create_simple_logger
 
+try:
+    # SIMD base64 codec with the stdlib API; much faster on multi-MB payloads
+    import pybase64  # type: ignore
+except ImportError:  # pragma: no cover
+    pybase64 = None
+
+try:
+    # ISA-L DEFLATE/CRC32 with the stdlib gzip/zlib APIs; several times faster
+    from isal import igzip as gzip_codec, isal_zlib as zlib_codec  # type: ignore
+except ImportError:  # pragma: no cover
+    gzip_codec = gzip
+    zlib_codec = zlib
+
+try:
+    # Multi-threaded gzip writer (multi-member output, readable by any gzip)
+    import mgzip  # type: ignore
+except ImportError:  # pragma: no cover
+    mgzip = None
+
+try:
+    # Parallel gzip reader
+    import rapidgzip  # type: ignore
+except ImportError:  # pragma: no cover
+    rapidgzip = None
+
+try:
+    # libvips: shrink-on-load thumbnails straight from the encoded bytes.
+    # Declared with its bundled binary; Pillow covers platforms without one.
+    import pyvips  # type: ignore
+except (ImportError, OSError):  # pragma: no cover - OSError: libvips missing
+    pyvips = None
+
 logger = create_simple_logger(__name__)
 
+# Pillow-SIMD (a drop-in Pillow fork with SSE4/AVX2 resize and decode kernels)
+# publishes versions like "9.5.0.post1".
+PILLOW_SIMD = ".post" in PIL.__version__
+if not PILLOW_SIMD:
+    logger.debug(
+        f"Using Pillow {PIL.__version__}; install pillow-simd for faster image decode/resize."
+    )
+
+# Payloads are mostly already-compressed parquet/PNG, so higher levels cost a
+# lot of CPU for little size gain.
+GZIP_COMPRESS_LEVEL = 1
+
+# Above this size gzip work is split across threads when mgzip/rapidgzip are
+# installed; below it the thread start-up costs more than it saves.
+PARALLEL_GZIP_MIN_BYTES = 4 * 1024 * 1024
+PARALLEL_GZIP_THREADS = os.cpu_count() or 1
+
+# Every gzip stream starts with these two bytes; payloads whose format is
+# already compressed are stored without a gzip layer and told apart by this.
+GZIP_MAGIC = b"\x1f\x8b"
+
+# zstd frames start with this magic. zstd level 3 compresses several times
+# faster than gzip at a similar ratio; Arrow's bundled codec is used, so no
+# extra dependency is needed.
+ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+ZSTD_COMPRESS_LEVEL = 3
+# Built once and shared: codec construction is not free, and Arrow's codecs
+# are safe to use from several threads
+_ZSTD = pa.Codec("zstd", compression_level=ZSTD_COMPRESS_LEVEL)
+
+# Image formats that are already entropy-coded; gzip on top only burns CPU.
+ALREADY_COMPRESSED_IMAGE_FORMATS = {"PNG", "JPEG", "JPG", "WEBP"}
+
+# Photographic sources are re-encoded as lossy WebP at this quality; method 4
+# is Pillow's default speed/size trade-off.
+WEBP_QUALITY = 85
+WEBP_METHOD = 4
+PHOTO_SOURCE_FORMATS = {"JPEG", "MPO", "WEBP"}
+
+# Input block size for streaming gzip+base64; the compressed output is encoded as
+# it is produced, in whole 3-byte groups.
+STREAM_CHUNK_BYTES = 64 * 1024
+
+# Artifacts are short-lived and only read back by this app: fast zstd pages and
+# no column statistics (nothing ever filters on them).
+PARQUET_WRITE_OPTIONS = {
+    "compression": "zstd",
+    "compression_level": 1,
+    "use_dictionary": True,
+    "write_statistics": False,
+    "data_page_size": 1 << 20,
+}
+
+# Arrow IPC buffers are zstd-compressed by pyarrow itself; the options object is
+# reusable, so it is built once instead of per call.
+ARROW_IPC_WRITE_OPTIONS = pa.ipc.IpcWriteOptions(compression="zstd")
+
 __all__ = [
     "decode_base64_to_bytes",
     "encode_bytes_to_base64",
     "DataFrameHandler",
     "ImageHandler",
     "compress_gzip",
+    "compress_zstd",
+    "decompress_zstd",
     "decompress_gzip",
+    "decompress_data",
+    "make_thumbnail",
+    "choose_image_format",
+    "read_csv_to_table",
+    "gzip_to_base64",
+    "gunzip_from_base64",
     "convert_to_raw_bytes",
 ]
 
@@ -25,6 +130,8 @@ __all__ = [
 def decode_base64_to_bytes(data: str) -> bytes:
     """Decode a base64 encoded string to bytes."""
     try:
+        if pybase64 is not None:
+            return pybase64.b64decode(data, validate=False)
         return base64.b64decode(data)
     except Exception as e:
         logger.error(f"Failed to decode base64 data: {e}")
@@ -34,7 +141,9 @@ def decode_base64_to_bytes(data: str) -> bytes:
 def encode_bytes_to_base64(data: bytes) -> str:
     """Encode bytes to a base64 encoded string."""
     try:
-        return base64.b64encode(data).decode("utf-8")
+        if pybase64 is not None:
+            return pybase64.b64encode_as_string(data)
+        return base64.b64encode(data).decode("ascii")
     except Exception as e:
         logger.error(f"Failed to encode data to base64: {e}")
         raise
@@ -43,8 +152,20 @@ def encode_bytes_to_base64(data: bytes) -> str:
 def decompress_gzip(data: bytes) -> bytes:
     """Decompress gzip compressed bytes."""
     try:
-        with gzip.GzipFile(fileobj=io.BytesIO(data)) as f:
-            return f.read()
+        if rapidgzip is not None and len(data) > PARALLEL_GZIP_MIN_BYTES:
+            with rapidgzip.open(
+                io.BytesIO(data), parallelization=PARALLEL_GZIP_THREADS
+            ) as f:
+                return f.read()
+        # One C call for the common single-member stream (wbits=31: gzip)
+        decompressor = zlib_codec.decompressobj(wbits=31)
+        out = decompressor.decompress(data)
+        if decompressor.unused_data.lstrip(b"\x00"):
+            # Multi-member stream (e.g. written by mgzip); gzip walks every member
+            return gzip_codec.decompress(data)
+        if not decompressor.eof:
+            raise EOFError("Compressed data ended before the end-of-stream marker")
+        return out
     except Exception as e:
         logger.error(f"Failed to decompress gzip data: {e}")
         raise
@@ -53,10 +174,15 @@ def decompress_gzip(data: bytes) -> bytes:
 def compress_gzip(data: bytes) -> bytes:
     """Compress bytes using gzip."""
     try:
-        out = io.BytesIO()
-        with gzip.GzipFile(fileobj=out, mode="wb") as f:
-            f.write(data)
-        return out.getvalue()
+        if mgzip is not None and len(data) > PARALLEL_GZIP_MIN_BYTES:
+            return mgzip.compress(
+                data,
+                compresslevel=GZIP_COMPRESS_LEVEL,
+                thread=PARALLEL_GZIP_THREADS,
+                blocksize=PARALLEL_GZIP_MIN_BYTES,
+            )
+        # Header, deflate and CRC trailer in one call (wbits=31: gzip)
+        return zlib_codec.compress(data, level=GZIP_COMPRESS_LEVEL, wbits=31)
     except Exception as e:
         logger.error(f"Failed to compress data with gzip: {e}")
         raise
@@ -98,6 +224,8 @@ def compress_data(data: bytes, compression: Optional[str]) -> bytes:
     """
     if compression == "gzip":
         return compress_gzip(data)
+    elif compression == "zstd":
+        return compress_zstd(data)
     elif compression is None:
         return data
     else:
@@ -105,6 +233,194 @@ def compress_data(data: bytes, compression: Optional[str]) -> bytes:
         raise ValueError(f"Unsupported compression: {compression}")
 
 
+def compress_zstd(data: bytes) -> bytes:
+    """Compress data into a standard zstd frame."""
+    return _ZSTD.compress(data, asbytes=True)
+
+
+def _zstd_content_size(data: bytes) -> Optional[int]:
+    """Decompressed size declared in a zstd frame header, if it has one."""
+    if len(data) < 6 or data[:4] != ZSTD_MAGIC:
+        return None
+    descriptor = data[4]
+    single_segment = descriptor >> 5 & 1
+    size_flag = descriptor >> 6
+    if size_flag == 0 and not single_segment:
+        return None
+    start = 5 + (not single_segment) + (0, 1, 2, 4)[descriptor & 3]
+    width = (1, 2, 4, 8)[size_flag]
+    field = data[start : start + width]
+    if len(field) < width:
+        return None
+    return int.from_bytes(field, "little") + (256 if width == 2 else 0)
+
+
+def decompress_zstd(data: bytes) -> bytes:
+    """Decompress a zstd frame (its size need not be known up front)."""
+    size = _zstd_content_size(data)
+    if size is not None:
+        try:
+            # One-shot decode into a buffer of the declared size
+            return _ZSTD.decompress(data, decompressed_size=size, asbytes=True)
+        except (OSError, pa.ArrowException):
+            # e.g. several concatenated frames; the stream reads them all
+            pass
+    with pa.CompressedInputStream(pa.BufferReader(data), "zstd") as stream:
+        return stream.read()
+
+
+def make_thumbnail(image: Image.Image, size=(128, 128)) -> Image.Image:
+    """Downscale an image to fit within ``size``, preserving aspect ratio.
+
+    Unlike ``image.copy().thumbnail(size)`` this never clones the full-size
+    pixel buffer: only the small target is allocated. Images that already fit
+    are returned as-is (never upscaled).
+    """
+    width, height = image.size
+    scale = min(size[0] / width, size[1] / height)
+    if scale >= 1:
+        return image
+    target = (max(1, round(width * scale)), max(1, round(height * scale)))
+    # Same filter and reducing_gap as Image.thumbnail
+    return image.resize(target, Image.Resampling.BICUBIC, reducing_gap=2.0)
+
+
+def choose_image_format(image: Image.Image, lossless: bool = False) -> str:
+    """Pick the storage format for an uploaded image.
+
+    Photos (JPEG/WebP sources without alpha) become lossy WebP, which is far
+    smaller than PNG and cheaper to encode. Everything else, and any image when
+    ``lossless`` is set, stays PNG.
+    """
+    if (
+        not lossless
+        and image.format in PHOTO_SOURCE_FORMATS
+        and image.mode in ("RGB", "L")
+    ):
+        return "webp"
+    return "png"
+
+
+def decompress_data(data: bytes, compression: Optional[str]) -> bytes:
+    """Decompress data based on the specified compression type.
+
+    With ``gzip`` or ``zstd`` the codec is picked from the data's magic bytes,
+    so either declared value reads both (payloads written before the switch to
+    zstd stay readable). Data with neither magic is returned as-is:
+    already-compressed formats are written without an outer layer.
+    """
+    if compression in ("gzip", "zstd"):
+        if data[:2] == GZIP_MAGIC:
+            return decompress_gzip(data)
+        if data[:4] == ZSTD_MAGIC:
+            return decompress_zstd(data)
+        return data
+    elif compression is None:
+        return data
+    else:
+        logger.error(f"Unsupported compression: {compression}")
+        raise ValueError(f"Unsupported compression: {compression}")
+
+
+def gunzip_from_base64(data: Union[str, bytes]) -> bytearray:
+    """Base64-decode and gunzip in one streaming pass.
+
+    Inverse of :func:`gzip_to_base64`. The base64 text is decoded in blocks that
+    are fed straight into the decompressor, so the full compressed payload is
+    never materialized. Handles multi-member streams; data that is not gzip
+    (no magic bytes) is returned base64-decoded only.
+    """
+    b64decode = pybase64.b64decode if pybase64 is not None else base64.b64decode
+    if b64decode(data[:4])[:2] != GZIP_MAGIC:
+        return bytearray(decode_base64_to_bytes(data))
+    try:
+        # Multiple of 4 so every block decodes on its own
+        step = STREAM_CHUNK_BYTES // 3 * 4
+        out = bytearray()
+        decompressor = zlib_codec.decompressobj(wbits=31)
+        member_open = False
+        for start in range(0, len(data), step):
+            compressed = b64decode(data[start : start + step])
+            while compressed:
+                out += decompressor.decompress(compressed)
+                member_open = True
+                compressed = b""
+                if decompressor.eof:
+                    compressed = decompressor.unused_data.lstrip(b"\x00")
+                    decompressor = zlib_codec.decompressobj(wbits=31)
+                    member_open = False
+        if member_open:
+            raise EOFError("Compressed data ended before the end-of-stream marker")
+        return out
+    except Exception as e:
+        logger.error(f"Failed to decode gzip+base64 data: {e}")
+        raise
+
+
+def decode_payload(
+    data: Union[str, bytes], encoding: Optional[str], compression: Optional[str]
+) -> Union[bytes, bytearray]:
+    """Turn a stored payload back into the raw serialized bytes."""
+    if isinstance(data, str) and encoding == "base64" and compression == "gzip":
+        # Inflates gzip while decoding; anything else comes back just decoded
+        raw = gunzip_from_base64(data)
+        return decompress_zstd(raw) if raw[:4] == ZSTD_MAGIC else raw
+    return decompress_data(convert_to_raw_bytes(data, encoding), compression)
+
+
+def _stream_gzip_blocks(data: bytes) -> Iterator[bytes]:
+    """Yield the gzip stream of ``data`` block by block from one compressor."""
+    # wbits=31 writes a gzip container
+    compressor = zlib_codec.compressobj(GZIP_COMPRESS_LEVEL, zlib.DEFLATED, 31)
+    view = memoryview(data)
+    for start in range(0, len(view), STREAM_CHUNK_BYTES):
+        yield compressor.compress(view[start : start + STREAM_CHUNK_BYTES])
+    yield compressor.flush()
+
+
+def _gzip_member(block: memoryview) -> bytes:
+    return zlib_codec.compress(block, level=GZIP_COMPRESS_LEVEL, wbits=31)
+
+
+def _base64_blocks(blocks: Iterable[bytes]) -> str:
+    """Base64-encode a stream of byte blocks as one contiguous payload."""
+    b64encode = pybase64.b64encode if pybase64 is not None else base64.b64encode
+    out = bytearray()
+    pending = b""
+    for block in blocks:
+        # Only whole 3-byte groups can be encoded without padding
+        pending += block
+        cut = len(pending) - len(pending) % 3
+        out += b64encode(pending[:cut])
+        pending = pending[cut:]
+    out += b64encode(pending)
+    return out.decode("ascii")
+
+
+def gzip_to_base64(data: bytes) -> str:
+    """Gzip-compress bytes and base64-encode the result in a single streaming pass.
+
+    Equivalent to ``encode_bytes_to_base64(compress_gzip(data))`` but the full
+    compressed payload is never held alongside the base64 output. Large
+    payloads are compressed as independent gzip members on a thread pool (zlib
+    releases the GIL) while finished members are already being encoded.
+    """
+    try:
+        if len(data) <= PARALLEL_GZIP_MIN_BYTES or PARALLEL_GZIP_THREADS == 1:
+            return _base64_blocks(_stream_gzip_blocks(data))
+
+        view = memoryview(data)
+        blocks = (
+            view[i : i + PARALLEL_GZIP_MIN_BYTES]
+            for i in range(0, len(view), PARALLEL_GZIP_MIN_BYTES)
+        )
+        with ThreadPoolExecutor(max_workers=PARALLEL_GZIP_THREADS) as pool:
+            return _base64_blocks(pool.map(_gzip_member, blocks))
+    except Exception as e:
+        logger.error(f"Failed to gzip and base64 encode data: {e}")
+        raise
+
+
 class FileHandlerBase:
     """Base class for handling special files like CSV, Parquet, and Images."""
 
@@ -118,7 +434,18 @@ class FileHandlerBase:
         self.data = data
         self.encoding = encoding
         self.compression = compression
-        self.supported_file_types = ["csv", "parquet", "image"]
+        self.supported_file_types = ["csv", "parquet", "arrow", "image"]
+
+    def _is_precompressed(self) -> bool:
+        """Whether the serialized format is already compressed (skip gzip)."""
+        return False
+
+    def _output_compression(self) -> Optional[str]:
+        """Compression to apply on output, skipping it over compressed formats."""
+        if self.compression is not None and self._is_precompressed():
+            logger.debug("Payload format is already compressed; skipping outer codec.")
+            return None
+        return self.compression
 
     def is_supported_file_type(self, file_type: str) -> bool:
         """Check if the file type is supported."""
@@ -140,34 +467,82 @@ class FileHandlerBase:
 def convert_df_to_csv_bytes(df: pd.DataFrame, **kwargs) -> bytes:
     """Convert a pandas DataFrame to CSV bytes."""
     try:
-        buffer = io.StringIO()
+        # pandas encodes straight into a binary buffer; no intermediate str copy
+        buffer = io.BytesIO()
+        kwargs.setdefault("encoding", "utf-8")
         df.to_csv(buffer, **kwargs)
-        return buffer.getvalue().encode("utf-8")
+        return buffer.getvalue()
     except Exception as e:
         logger.error(f"Failed to convert DataFrame to CSV bytes: {e}")
         raise
 
 
+def read_csv_to_table(
+    data: bytes, encoding: str = "utf-8", delimiter: str = ",", header: bool = True
+) -> pa.Table:
+    """Parse CSV bytes into an Arrow table with Arrow's multithreaded reader.
+
+    Without a header row the columns are named "0", "1", ..., which is what
+    pandas' positional names become once written to parquet.
+    """
+    table = pa_csv.read_csv(
+        pa.BufferReader(data),
+        read_options=pa_csv.ReadOptions(
+            use_threads=True, encoding=encoding, autogenerate_column_names=not header
+        ),
+        parse_options=pa_csv.ParseOptions(delimiter=delimiter),
+    )
+    if not header:
+        table = table.rename_columns([str(i) for i in range(table.num_columns)])
+    return table
+
+
+def convert_table_to_parquet_bytes(table: pa.Table, **kwargs) -> bytes:
+    """Convert an Arrow table to Parquet bytes."""
+    try:
+        sink = pa.BufferOutputStream()
+        pq.write_table(table, sink, **{**PARQUET_WRITE_OPTIONS, **kwargs})
+        return sink.getvalue().to_pybytes()
+    except Exception as e:
+        logger.error(f"Failed to convert table to Parquet bytes: {e}")
+        raise
+
+
 def convert_df_to_parquet_bytes(df: pd.DataFrame, **kwargs) -> bytes:
     """Convert a pandas DataFrame to Parquet bytes."""
+    # Same index handling as DataFrame.to_parquet (RangeIndex kept as metadata)
+    table = pa.Table.from_pandas(df, preserve_index=kwargs.pop("index", None))
+    return convert_table_to_parquet_bytes(table, **kwargs)
+
+
+def convert_table_to_arrow_bytes(table: pa.Table) -> bytes:
+    """Convert an Arrow table to Arrow IPC (Feather v2) bytes with zstd-compressed buffers."""
     try:
-        buffer = io.BytesIO()
-        df.to_parquet(buffer, **kwargs)
-        return buffer.getvalue()
+        sink = pa.BufferOutputStream()
+        with pa.ipc.new_file(
+            sink, table.schema, options=ARROW_IPC_WRITE_OPTIONS
+        ) as writer:
+            writer.write_table(table)
+        return sink.getvalue().to_pybytes()
     except Exception as e:
-        logger.error(f"Failed to convert DataFrame to Parquet bytes: {e}")
+        logger.error(f"Failed to convert table to Arrow bytes: {e}")
         raise
 
 
+def convert_df_to_arrow_bytes(df: pd.DataFrame, **kwargs) -> bytes:
+    """Convert a pandas DataFrame to Arrow IPC (Feather v2) bytes with zstd-compressed buffers."""
+    return convert_table_to_arrow_bytes(pa.Table.from_pandas(df, **kwargs))
+
+
 class DataFrameHandler(FileHandlerBase):
     """Handler for pandas DataFrame files."""
 
     def __init__(
         self,
-        data: Union[str, bytes, pd.DataFrame],
+        data: Union[str, bytes, pd.DataFrame, pa.Table],
         file_format: str = "parquet",
         encoding: Optional[str] = "base64",
-        compression: Optional[str] = "gzip",
+        compression: Optional[str] = "zstd",
         **kwargs,
     ):
         super().__init__(data, encoding, compression, **kwargs)
@@ -175,24 +550,83 @@ class DataFrameHandler(FileHandlerBase):
             raise ValueError(f"Unsupported file type: {file_format}")
         self.kwargs = kwargs
         self.file_format = file_format
-
-        if isinstance(data, pd.DataFrame):
+        # An Arrow table is only turned into pandas when the frame is asked for
+        self._table: Optional[pa.Table] = None
+        self._df: Optional[pd.DataFrame] = None
+        # Parquet input is kept as-is: its footer gives the shape, and the
+        # bytes are stored again without a decode/encode round trip
+        self._source_parquet: Optional[bytes] = None
+
+        if isinstance(data, pa.Table):
+            self._table = data
+        elif isinstance(data, pd.DataFrame):
             self.df = data
         else:
-            raw_bytes = convert_to_raw_bytes(data, encoding)
-            if compression == "gzip":
-                raw_bytes = decompress_gzip(raw_bytes)
-            elif compression is not None:
-                raise ValueError(f"Unsupported compression: {compression}")
+            raw_bytes = decode_payload(data, encoding, compression)
 
             if file_format == "csv":
-                method_to_use = pd.read_csv
+                self.df = pd.read_csv(io.BytesIO(raw_bytes), **kwargs)
+            elif file_format == "parquet" and not kwargs:
+                self._source_parquet = raw_bytes
             elif file_format == "parquet":
-                method_to_use = pd.read_parquet
+                # Zero-copy view for Arrow; self_destruct frees each column as
+                # it is converted, so the table and the frame never coexist
+                table = pq.read_table(pa.py_buffer(raw_bytes), **kwargs)
+                self.df = table.to_pandas(split_blocks=True, self_destruct=True)
+            elif file_format == "arrow":
+                table = feather.read_table(pa.BufferReader(raw_bytes), **kwargs)
+                self.df = table.to_pandas(split_blocks=True, self_destruct=True)
             else:
                 raise ValueError(f"Unsupported file format: {file_format}")
 
-            self.df = method_to_use(io.BytesIO(raw_bytes), **kwargs)
+    @property
+    def df(self) -> pd.DataFrame:
+        """The DataFrame, converted from the Arrow table on first access."""
+        if self._df is None:
+            table, self._table = self._table, None
+            if table is None:
+                table = pq.read_table(pa.py_buffer(self._source_parquet))
+            self._df = table.to_pandas(split_blocks=True, self_destruct=True)
+        return self._df
+
+    @df.setter
+    def df(self, value: pd.DataFrame) -> None:
+        self._df = value
+
+    def _parquet_footer(self) -> Tuple[int, List[str]]:
+        """Row count and data column names from the parquet footer alone.
+
+        Columns pandas wrote for a non-default index are left out, matching
+        the frame the file decodes to.
+        """
+        parquet_file = pq.ParquetFile(pa.BufferReader(self._source_parquet))
+        schema = parquet_file.schema_arrow
+        index_columns = {
+            name
+            for name in (schema.pandas_metadata or {}).get("index_columns", [])
+            if isinstance(name, str)
+        }
+        columns = [name for name in schema.names if name not in index_columns]
+        return parquet_file.metadata.num_rows, columns
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        """(rows, columns), read without building a DataFrame from the table."""
+        if self._df is not None:
+            return self._df.shape
+        if self._table is not None:
+            return self._table.shape
+        num_rows, columns = self._parquet_footer()
+        return num_rows, len(columns)
+
+    @property
+    def columns(self) -> List[str]:
+        """Column names, read without building a DataFrame from the table."""
+        if self._df is not None:
+            return [str(c) for c in self._df.columns]
+        if self._table is not None:
+            return self._table.column_names
+        return self._parquet_footer()[1]
 
     def get_python_friendly_format(self) -> pd.DataFrame:
         """Return the DataFrame."""
@@ -200,24 +634,43 @@ class DataFrameHandler(FileHandlerBase):
 
     def _convert_to_bytes(self) -> bytes:
         """Convert the DataFrame to bytes based on the specified file format."""
+        if self._source_parquet is not None and self._df is None:
+            return self._source_parquet
+        if self._table is not None and self.file_format == "parquet":
+            return convert_table_to_parquet_bytes(self._table, **self.kwargs)
+        if self._table is not None and self.file_format == "arrow":
+            return convert_table_to_arrow_bytes(self._table)
         if self.file_format == "csv":
             return convert_df_to_csv_bytes(self.df, **self.kwargs)
         elif self.file_format == "parquet":
             return convert_df_to_parquet_bytes(self.df, **self.kwargs)
+        elif self.file_format == "arrow":
+            return convert_df_to_arrow_bytes(self.df, **self.kwargs)
         else:
             logger.error(f"Unsupported file format: {self.file_format}")
             raise ValueError(f"Unsupported file format: {self.file_format}")
 
+    def _is_precompressed(self) -> bool:
+        # Arrow IPC buffers and parquet pages are zstd-compressed by default
+        if self.file_format == "arrow":
+            return True
+        if self.file_format == "parquet":
+            return self.kwargs.get("compression", "zstd") is not None
+        return False
+
     def get_base64_representation(self) -> str:
         """Get the base64 representation of the DataFrame."""
         raw_bytes = self._convert_to_bytes()
-        compressed_bytes = compress_data(raw_bytes, self.compression)
+        compression = self._output_compression()
+        if compression == "gzip":
+            return gzip_to_base64(raw_bytes)
+        compressed_bytes = compress_data(raw_bytes, compression)
         return encode_bytes_to_base64(compressed_bytes)
 
     def get_raw_bytes(self) -> bytes:
         """Get the raw bytes of the DataFrame."""
         raw_bytes = self._convert_to_bytes()
-        raw_bytes = compress_data(raw_bytes, self.compression)
+        raw_bytes = compress_data(raw_bytes, self._output_compression())
         return raw_bytes
 
     def _repr_html_(self):
@@ -238,59 +691,149 @@ class ImageHandler(FileHandlerBase):
     ):
         super().__init__(data, encoding, compression, **kwargs)
         self.image_format = image_format
+        # Encoded image bytes per format; the image is never mutated in place
+        self._encoded: Dict[str, bytes] = {}
+        # Original encoded bytes: stored as-is when the output format matches,
+        # and used for DCT-scaled JPEG thumbnails
+        self._source_bytes: Optional[bytes] = None
+        # Canonical base64 input, returned instead of re-encoding the same bytes
+        self._source_base64: Optional[str] = None
 
         if isinstance(data, Image.Image):
             self.image = data
         else:
-            raw_bytes = convert_to_raw_bytes(data, encoding)
-            if compression == "gzip":
-                raw_bytes = decompress_gzip(raw_bytes)
-            elif compression is not None:
-                raise ValueError(f"Unsupported compression: {compression}")
+            raw_bytes = decode_payload(data, encoding, compression)
 
             try:
                 self.image = Image.open(io.BytesIO(raw_bytes))
+                # Decode now so corrupt or truncated data fails here, not in a
+                # later save(), and never reaches the pass-through path
+                self.image.load()
             except Exception as e:
                 logger.error(f"Failed to open image: {e}")
                 raise
+            self._source_bytes = raw_bytes
+            # b64decode skips stray characters, so only the exact length of
+            # the bytes' own encoding guarantees the string is canonical
+            if (
+                isinstance(data, str)
+                and encoding == "base64"
+                and not compression
+                and len(data) == 4 * -(-len(raw_bytes) // 3)
+            ):
+                self._source_base64 = data
 
     def get_python_friendly_format(self) -> Image.Image:
         """Return the PIL Image."""
         return self.image
 
+    def _save_to_bytes(self, image: Image.Image) -> bytes:
+        """Encode an image in the handler's format."""
+        buffer = io.BytesIO()
+        if self.image_format.upper() == "WEBP":
+            image.save(buffer, format="WEBP", quality=WEBP_QUALITY, method=WEBP_METHOD)
+        else:
+            image.save(buffer, format=self.image_format)
+        return buffer.getvalue()
+
+    def _is_source_format(self) -> bool:
+        source_format = self.image.format
+        output_format = self.image_format.upper()
+        return source_format is not None and source_format == (
+            "JPEG" if output_format == "JPG" else output_format
+        )
+
+    def _encode(self) -> bytes:
+        """Encode the image once per format and reuse the bytes afterwards.
+
+        Already-encoded input in the requested format is passed through
+        untouched: re-encoding would cost CPU and, for lossy formats, quality.
+        """
+        if self.image_format not in self._encoded:
+            if self._source_bytes is not None and self._is_source_format():
+                self._encoded[self.image_format] = self._source_bytes
+            else:
+                self._encoded[self.image_format] = self._save_to_bytes(self.image)
+        return self._encoded[self.image_format]
+
     def get_base64_representation(self) -> str:
         """Get the base64 representation of the image."""
-        buffer = io.BytesIO()
-        self.image.save(buffer, format=self.image_format)
-        raw_bytes = buffer.getvalue()
-        return encode_bytes_to_base64(raw_bytes)
+        if self._source_base64 is not None and self._is_source_format():
+            return self._source_base64
+        return encode_bytes_to_base64(self._encode())
+
+    def _is_precompressed(self) -> bool:
+        return self.image_format.upper() in ALREADY_COMPRESSED_IMAGE_FORMATS
 
     def get_raw_bytes(self) -> bytes:
         """Get the raw bytes of the image."""
-        buffer = io.BytesIO()
-        self.image.save(buffer, format=self.image_format)
-        raw_bytes = buffer.getvalue()
-        raw_bytes = compress_data(raw_bytes, self.compression)
-        return raw_bytes
+        return compress_data(self._encode(), self._output_compression())
+
+    def _make_thumbnail(self, size=(128, 128)) -> Image.Image:
+        """Downscale the image, letting libjpeg do most of the work for JPEGs.
+
+        ``draft()`` makes the decoder scale by 1/2, 1/4 or 1/8 while decoding,
+        so a large photo is never resized from full resolution.
+        """
+        if self._source_bytes is None or self.image.format not in ("JPEG", "MPO"):
+            return make_thumbnail(self.image, size)
+        image = Image.open(io.BytesIO(self._source_bytes))
+        image.draft(self.image.mode, size)
+        return make_thumbnail(image, size)
+
+    def _vips_thumbnail(self, size=(128, 128)) -> Optional[bytes]:
+        """Encode the thumbnail with libvips, or return None to use Pillow.
+
+        ``thumbnail_buffer`` works from the encoded bytes: JPEG and WebP are
+        shrunk while decoding and PNG is streamed, and the handler's own
+        image is not decoded for it. EXIF orientation is ignored, as on the
+        Pillow path, so the thumbnail matches the stored image.
+        """
+        if pyvips is None or self._source_bytes is None:
+            return None
+        suffix = "." + self.image_format.lower()
+        options = {"Q": WEBP_QUALITY} if suffix == ".webp" else {}
+        try:
+            thumbnail = pyvips.Image.thumbnail_buffer(
+                self._source_bytes,
+                size[0],
+                height=size[1],
+                size="down",
+                no_rotate=True,
+            )
+            return thumbnail.write_to_buffer(suffix, **options)
+        except pyvips.Error as e:
+            logger.debug(f"libvips thumbnail failed, using Pillow: {e}")
+            return None
+
+    def _encode_thumbnail(self, size=(128, 128)) -> bytes:
+        encoded = self._vips_thumbnail(size)
+        if encoded is None:
+            encoded = self._save_to_bytes(self._make_thumbnail(size))
+        return encoded
 
     def get_thumbnail_bytes(self, size=(128, 128)) -> bytes:
         """Get the raw bytes of the thumbnail image."""
-        thumbnail = self.image.copy()
-        thumbnail.thumbnail(size)
-        buffer = io.BytesIO()
-        thumbnail.save(buffer, format=self.image_format)
-        raw_bytes = buffer.getvalue()
-        raw_bytes = compress_data(raw_bytes, self.compression)
-        return raw_bytes
+        return compress_data(
+            self._encode_thumbnail(size), self._output_compression()
+        )
 
     def get_thumbnail_base64(self, size=(128, 128)) -> str:
         """Get the base64 representation of the thumbnail image."""
-        thumbnail = self.image.copy()
-        thumbnail.thumbnail(size)
-        buffer = io.BytesIO()
-        thumbnail.save(buffer, format=self.image_format)
-        raw_bytes = buffer.getvalue()
-        return encode_bytes_to_base64(raw_bytes)
+        return encode_bytes_to_base64(self._encode_thumbnail(size))
+
+    def get_full_and_thumbnail(self, size=(128, 128)) -> Tuple[str, str]:
+        """Get base64 strings for the full image and its thumbnail.
+
+        Both come from the single decoded ``self.image``; the full-size
+        encoding is memoised so later calls reuse it. An image that already
+        fits within ``size`` is its own thumbnail, so it is not encoded twice.
+        """
+        full = self.get_base64_representation()
+        width, height = self.image.size
+        if width <= size[0] and height <= size[1]:
+            return full, full
+        return full, self.get_thumbnail_base64(size)
 
     def _repr_html_(self):
         """HTML representation for Jupyter Notebooks."""
@@ -3,14 +3,38 @@
 Key prefix and structure follow storage_options_temp.md:
 
 - prefix: "chatapp:prod:"
-- Artifacts: prefix + "artifact:{artifact_id}"
+- Artifacts: prefix + "artifact:{artifact_id}" -> packed artifact, or a parts manifest
+  for payloads above ARTIFACT_CHUNK_BYTES whose bytes live in
+  prefix + "artifact:{artifact_id}:part:{i}"
 - Messages:  prefix + "message:{message_id}"
-- Sessions:  prefix + "session:{session_id}"
+- Sessions:  prefix + "session:{session_id}" -> Redis HASH of session metadata (messages live under their own keys)
 - Indexes:
-  - Session Indexes on User ID:          prefix + "session_index:user:{user_id}" -> JSON list[SessionInfo]
-  - Message Indexes on Session ID:        prefix + "message_index:session:{session_id}" -> JSON list[str] (messageIds)
-  - Artifact Indexes on Message ID:       prefix + "artifact_index:message:{message_id}" -> JSON list[str] (artifactIds)
-  - Uploaded File Artifacts on Session ID: prefix + "file_artifact_index:session:{session_id}" -> JSON list[str] (artifactIds)
+  - Session Indexes on User ID:          prefix + "session_index:user:{user_id}" -> Redis ZSET of sessionIds scored by updatedAt,
+    each with its JSON SessionInfo at prefix + "session_info:{session_id}"
+  - Message Indexes on Session ID:        prefix + "message_index:session:{session_id}" -> Redis LIST of messageIds
+  - Artifact Indexes on Message ID:       prefix + "artifact_index:message:{message_id}" -> Redis ZSET of artifactIds
+  - Uploaded File Artifacts on Session ID: prefix + "file_artifact_index:session:{session_id}" -> Redis ZSET of artifactIds
+
+Artifact ZSETs are scored by insertion time (ZADD NX), so they stay unique and
+keep the order artifacts were added in.
+
+Artifact keys and their parts share an "{artifact_id}" hash tag; session-scoped
+keys (session hash, session info, message index, file artifact index) wrap the
+session id in literal braces, e.g. "session:{session_abc}". That Redis hash tag
+puts them in one cluster slot, so multi-key commands and scripts over a session
+stay valid on Redis Cluster.
+
+Message, artifact and session-info values are MessagePack (a b"\x01" tag byte
+followed by the packed model). Untagged JSON values written by older versions
+are still read. Values larger than CACHE_COMPRESS_MIN_BYTES are zstd-compressed
+when that makes them smaller (a b"\x02" tag, the uncompressed size, then the
+zstd frame). The base64 payload of CSV/image artifacts is stored as raw bytes
+and re-encoded on read, so callers always see the base64 string.
+
+With CACHE_COMPACT_KEYS=1 the same keys use short namespaces instead: "a:",
+"m:", "s:", "si:", "iu:" (sessions of a user), "im:" (messages of a session),
+"ia:" (artifacts of a message), "if:" (file artifacts of a session), and
+":p:" for artifact parts.
 
 This helper provides typed get/set/delete plus index maintenance. It uses
 Pydantic models from app.models.object_models.
@@ -18,14 +42,23 @@ Pydantic models from app.models.object_models.
 
 from __future__ import annotations
 
+import binascii
 import json
 import os
-from typing import List, Optional, Union
-
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Set, Union
+
+import ormsgpack
+import pyarrow as pa
 import redis
-from pydantic import TypeAdapter
+from pydantic import BaseModel, TypeAdapter
 
 from app.models.object_models import Artifact, Message, Session, SessionInfo
+from app.services.storage.files_handler import encode_bytes_to_base64
 from app.utils import create_simple_logger
 
 
@@ -33,18 +66,193 @@ logger = create_simple_logger(__name__)
 
 All_Objects = Union[Artifact, Message, Session, SessionInfo]
 
+# Sentinel for attribute lookups where None is a legitimate value
+_MISSING = object()
+
+# Building a TypeAdapter compiles a pydantic-core validator and serializer, so
+# they are built once here rather than on every read.
+_MESSAGE_TA = TypeAdapter(Message)
+_ARTIFACT_TA = TypeAdapter(Artifact)
+_SESSION_INFO_TA = TypeAdapter(SessionInfo)
+
+# Sessions read during the current request, keyed by Redis key. Only populated
+# inside session_cache_scope() (entered per HTTP request in app.main), so code
+# running outside a request always reads through to Redis.
+_session_cache: ContextVar[Optional[Dict[str, Session]]] = ContextVar(
+    "session_cache", default=None
+)
+
+# Artifact payloads larger than this are stored as fixed-size parts so no single
+# Redis value grows into the multi-MiB range that stalls the server.
+ARTIFACT_CHUNK_BYTES = int(os.environ.get("CACHE_ARTIFACT_CHUNK_BYTES", 1024 * 1024))
+_PARTS_MANIFEST_PREFIX = b'{"__parts__"'
+# A manifest is a few dozen bytes; deletes read only this much of each value
+# to find parts instead of fetching whole payloads.
+_MANIFEST_PROBE_BYTES = 128
+
+# Keys per UNLINK command in cascade deletes; bounds each command's size while
+# the values themselves are freed off Redis's main thread.
+UNLINK_CHUNK_KEYS = 128
+
+# Key namespaces (after the prefix). CACHE_COMPACT_KEYS=1 selects the short
+# forms, which save memory and wire bytes on every key; both schemas keep the
+# same hash tags. Switching schemas orphans existing keys until they expire.
+# The user and message indexes are sorted sets under new names: the old names
+# held JSON strings, and reusing them would make ZADD/ZRANGE fail with WRONGTYPE
+# until those keys expired.
+_KEY_NAMES = {
+    "artifact": "artifact:",
+    "part": ":part:",
+    "meta": ":meta",
+    "message": "message:",
+    "session": "session:",
+    "session_index": "session_zindex:user:",
+    "session_info": "session_info:",
+    "message_index": "message_index:session:",
+    "artifact_index": "artifact_zindex:message:",
+    "file_artifact_index": "file_artifact_index:session:",
+}
+_COMPACT_KEY_NAMES = {
+    "artifact": "a:",
+    "part": ":p:",
+    "meta": ":i",
+    "message": "m:",
+    "session": "s:",
+    "session_index": "iu:",
+    "session_info": "si:",
+    "message_index": "im:",
+    "artifact_index": "ia:",
+    "file_artifact_index": "if:",
+}
+
+# First byte of MessagePack-encoded values; JSON values start with "{"
+_MSGPACK_TAG = b"\x01"
+# Prefix of zstd-compressed values, followed by the 8-byte uncompressed size
+_ZSTD_TAG = b"\x02"
+COMPRESS_MIN_BYTES = int(os.environ.get("CACHE_COMPRESS_MIN_BYTES", 1024))
+# pyarrow is already a dependency and bundles libzstd
+_ZSTD = pa.Codec("zstd", compression_level=3)
+# Batch reads holding more compressed bytes than this inflate them on several
+# threads (libzstd releases the GIL); smaller batches are not worth the pool.
+PARALLEL_DECOMPRESS_MIN_BYTES = int(
+    os.environ.get("CACHE_PARALLEL_DECOMPRESS_MIN_BYTES", 4 * 1024 * 1024)
+)
+PARALLEL_DECOMPRESS_THREADS = os.cpu_count() or 1
+# Artifact types whose data is base64 of a binary file, and the marker left in
+# a packed artifact whose data was stored as the decoded bytes
+_BINARY_ARTIFACT_TYPES = frozenset({"csv", "image"})
+_RAW_DATA_MARKER = "__raw_data__"
+# Bulky fields left out of the per-artifact metadata hash
+_ARTIFACT_META_EXCLUDE = frozenset({"data", "thumbnail_data"})
+
+# Refresh the TTL (ARGV[1]) of a session's own keys: KEYS are the session
+# hash, session info, message index and file artifact index, which share one
+# hash tag. ARGV[2] is the expected owner ('' skips the check). Returns nil if
+# the session is gone or owned by someone else, else {keys touched, message
+# ids, file artifact ids} so the caller can refresh what lives in other slots.
+EXTEND_TTL_SCRIPT = """
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    return false
+end
+if ARGV[2] ~= '' and redis.call('HGET', KEYS[1], 'userId') ~= ARGV[2] then
+    return false
+end
+local touched = 0
+for _, key in ipairs(KEYS) do
+    if redis.call('EXPIRE', key, ARGV[1]) == 1 then
+        touched = touched + 1
+    end
+end
+local message_ids = redis.call('LRANGE', KEYS[3], 0, -1)
+local file_ids = redis.call('ZRANGE', KEYS[4], 0, -1)
+return {touched, message_ids, file_ids}
+"""
+
+# Adjust a session's counters without resurrecting it: KEYS[1] is the session
+# hash; ARGV are the numMessages and numArtifacts deltas, the TTL, then field
+# and value pairs to set. Returns nil if the session is gone (nothing is
+# written), else the updated hash as HGETALL returns it.
+RECORD_MESSAGE_SCRIPT = """
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    return false
+end
+redis.call('HINCRBY', KEYS[1], 'numMessages', ARGV[1])
+redis.call('HINCRBY', KEYS[1], 'numArtifacts', ARGV[2])
+if #ARGV > 3 then
+    redis.call('HSET', KEYS[1], unpack(ARGV, 4))
+end
+redis.call('EXPIRE', KEYS[1], ARGV[3])
+return redis.call('HGETALL', KEYS[1])
+"""
+
+# Delete a session owned by ARGV[1] ('' skips the check) atomically. KEYS are
+# the session hash, session info, message index and file artifact index, which
+# share one hash tag. Unless ARGV[2] is '1' (cascade) only the hash goes.
+# Returns nil if the session is missing or not owned, else
+# {owner, keys removed, message ids, file artifact ids}; the ids are read
+# before the indexes are removed.
+DELETE_SESSION_SCRIPT = """
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    return false
+end
+local owner = redis.call('HGET', KEYS[1], 'userId') or ''
+if ARGV[1] ~= '' and owner ~= ARGV[1] then
+    return false
+end
+if ARGV[2] ~= '1' then
+    return {owner, redis.call('UNLINK', KEYS[1]), {}, {}}
+end
+local message_ids = redis.call('LRANGE', KEYS[3], 0, -1)
+local file_ids = redis.call('ZRANGE', KEYS[4], 0, -1)
+local removed = redis.call('UNLINK', KEYS[1], KEYS[2], KEYS[3], KEYS[4])
+return {owner, removed, message_ids, file_ids}
+"""
+
+
+@contextmanager
+def session_cache_scope():
+    """Cache sessions fetched by RedisCache.get_session for the enclosed scope."""
+    token = _session_cache.set({})
+    try:
+        yield
+    finally:
+        _session_cache.reset(token)
+
+
+_connection_pool: Optional[redis.BlockingConnectionPool] = None
+
+
+def _get_connection_pool() -> redis.BlockingConnectionPool:
+    """Process-wide pool so every client reuses the same keep-alive sockets.
+
+    The pool is bounded (REDIS_POOL_SIZE); when every connection is busy a
+    caller waits up to 5s for one to be released instead of opening more.
+    """
+    global _connection_pool
+    if _connection_pool is None:
+        host = os.environ.get("REDIS_HOST", "localhost")
+        logger.info(f"Connecting to Redis at {host}")
+        _connection_pool = redis.BlockingConnectionPool(
+            host=host,
+            port=int(os.environ.get("REDIS_PORT", 6379)),
+            username=os.environ.get("REDIS_USERNAME"),
+            password=os.environ.get("REDIS_PASSWORD"),
+            max_connections=int(os.environ.get("REDIS_POOL_SIZE", 32)),
+            timeout=5,
+            socket_connect_timeout=5,
+            socket_timeout=5,
+            socket_keepalive=True,
+            # PING idle connections before reuse so stale sockets are replaced
+            health_check_interval=30,
+            retry_on_timeout=True,
+            # Values are handed to pydantic/ormsgpack as bytes; never decode them
+            decode_responses=False,
+        )
+    return _connection_pool
+
 
 def _build_redis_client() -> redis.Redis:
-    host = os.environ.get("REDIS_HOST", "localhost")
-    logger.info(f"Connecting to Redis at {host}")
-    return redis.Redis(
-        host=os.environ.get("REDIS_HOST", "localhost"),
-        port=int(os.environ.get("REDIS_PORT", 6379)),
-        username=os.environ.get("REDIS_USERNAME"),
-        password=os.environ.get("REDIS_PASSWORD"),
-        socket_connect_timeout=5,
-        socket_timeout=5,
-    )
+    return redis.Redis(connection_pool=_get_connection_pool())
 
 
 class RedisCache:
@@ -56,46 +264,250 @@ class RedisCache:
         *,
         prefix: Optional[str] = None,
         ttl_seconds: Optional[int] = None,
+        compact_keys: Optional[bool] = None,
     ) -> None:
         self.redis = redis_client or _build_redis_client()
         # Allow overriding via env; default per spec
         self.prefix = prefix or os.environ.get("CACHE_PREFIX", "chatapp:prod:")
         # Default TTL 1 hour (align with existing redis storage)
         self.ttl = ttl_seconds or int(os.environ.get("CACHE_TTL_SECONDS", 6 * 60 * 60))
+        # Script objects run via EVALSHA and reload themselves on NOSCRIPT
+        self._extend_ttl_script = self.redis.register_script(EXTEND_TTL_SCRIPT)
+        self._record_message_script = self.redis.register_script(
+            RECORD_MESSAGE_SCRIPT
+        )
+        self._delete_session_script = self.redis.register_script(
+            DELETE_SESSION_SCRIPT
+        )
+        if compact_keys is None:
+            compact_keys = os.environ.get("CACHE_COMPACT_KEYS", "").lower() in (
+                "1",
+                "true",
+                "yes",
+            )
+        self._bind_key_prefixes(compact_keys)
 
     # --- key builders -----------------------------------------------------
+    def _bind_key_prefixes(self, compact: bool) -> None:
+        names = _COMPACT_KEY_NAMES if compact else _KEY_NAMES
+        # Pre-concatenated so building a key is a single string concat
+        self._k_artifact = self.prefix + names["artifact"] + "{"
+        self._k_artifact_part = "}" + names["part"]
+        self._k_artifact_meta = "}" + names["meta"]
+        self._k_message = self.prefix + names["message"]
+        self._k_session = self.prefix + names["session"] + "{"
+        self._k_session_index_by_user = self.prefix + names["session_index"]
+        self._k_session_info = self.prefix + names["session_info"] + "{"
+        self._k_message_index = self.prefix + names["message_index"] + "{"
+        self._k_artifact_index = self.prefix + names["artifact_index"]
+        self._k_file_artifact_index = self.prefix + names["file_artifact_index"] + "{"
+
     def k_artifact(self, artifact_id: str) -> str:
-        return f"{self.prefix}artifact:{artifact_id}"
+        return self._k_artifact + artifact_id + "}"
+
+    def k_artifact_part(self, artifact_id: str, index: int) -> str:
+        return self._k_artifact + artifact_id + self._k_artifact_part + str(index)
+
+    def k_artifact_meta(self, artifact_id: str) -> str:
+        return self._k_artifact + artifact_id + self._k_artifact_meta
 
     def k_message(self, message_id: str) -> str:
-        return f"{self.prefix}message:{message_id}"
+        return self._k_message + message_id
 
     def k_session(self, session_id: str) -> str:
-        return f"{self.prefix}session:{session_id}"
+        return self._k_session + session_id + "}"
 
     def k_session_index_by_user(self, user_id: str) -> str:
-        return f"{self.prefix}session_index:user:{user_id}"
+        return self._k_session_index_by_user + user_id
+
+    def k_session_info(self, session_id: str) -> str:
+        return self._k_session_info + session_id + "}"
 
     def k_message_index_by_session(self, session_id: str) -> str:
-        return f"{self.prefix}message_index:session:{session_id}"
+        return self._k_message_index + session_id + "}"
 
     def k_artifact_index_by_message(self, message_id: str) -> str:
-        return f"{self.prefix}artifact_index:message:{message_id}"
+        return self._k_artifact_index + message_id
 
     def k_file_artifact_index_by_session(self, session_id: str) -> str:
-        return f"{self.prefix}file_artifact_index:session:{session_id}"
+        return self._k_file_artifact_index + session_id + "}"
 
     # --- low-level helpers ------------------------------------------------
-    def _set_json(self, key: str, payload_json: str, ttl: Optional[int] = None) -> None:
-        self.redis.setex(key, ttl or self.ttl, payload_json)
+    def _set_bytes(
+        self,
+        key: str,
+        payload: bytes,
+        ttl: Optional[int] = None,
+        pipe: Optional[redis.client.Pipeline] = None,
+    ) -> None:
+        (self.redis if pipe is None else pipe).setex(key, ttl or self.ttl, payload)
 
-    def _get_json(self, key: str) -> Optional[str]:
-        raw = self.redis.get(key)
-        if raw is None:
-            return None
-        if isinstance(raw, bytes):
-            return raw.decode("utf-8")
-        return str(raw)
+    @staticmethod
+    def _artifact_dicts(dumped: Dict) -> List[Dict]:
+        """Artifact dicts in a dumped artifact or message (with its artifacts)."""
+        if "artifactId" in dumped:
+            return [dumped]
+        return dumped.get("artifacts") or []
+
+    @staticmethod
+    def _pack_binary_data(dumped: Dict) -> Dict:
+        """Swap base64 ``data`` of binary artifacts for the bytes it encodes.
+
+        Only lossless swaps are made: the string must be canonical base64 that
+        re-encodes to itself, so anything else is stored unchanged.
+        """
+        for art in RedisCache._artifact_dicts(dumped):
+            data = art.get("data")
+            if art.get("type") not in _BINARY_ARTIFACT_TYPES or not isinstance(
+                data, str
+            ):
+                continue
+            try:
+                raw = binascii.a2b_base64(data, strict_mode=True)
+            except (binascii.Error, ValueError):
+                continue
+            if encode_bytes_to_base64(raw) == data:
+                art["data"] = raw
+                art[_RAW_DATA_MARKER] = True
+        return dumped
+
+    @staticmethod
+    def _unpack_binary_data(loaded: Dict) -> Dict:
+        """Inverse of :meth:`_pack_binary_data`."""
+        for art in RedisCache._artifact_dicts(loaded):
+            if art.pop(_RAW_DATA_MARKER, False):
+                art["data"] = encode_bytes_to_base64(art["data"])
+        return loaded
+
+    @staticmethod
+    def _dumps(model: BaseModel) -> bytes:
+        """Serialize a model for storage as tagged MessagePack."""
+        # None fields are left out (every Optional field defaults to None, so
+        # validation restores them) to keep values small
+        dumped = RedisCache._pack_binary_data(
+            model.model_dump(mode="python", exclude_none=True)
+        )
+        payload = _MSGPACK_TAG + ormsgpack.packb(dumped)
+        return RedisCache._compress(payload)
+
+    @staticmethod
+    def _compress(payload: bytes) -> bytes:
+        """zstd-compress large payloads, keeping the result only if it is smaller."""
+        if len(payload) < COMPRESS_MIN_BYTES:
+            return payload
+        compressed = _ZSTD.compress(payload, asbytes=True)
+        if len(compressed) + 9 >= len(payload):
+            # Already-compressed data (gzip/parquet artifacts) stays as is
+            return payload
+        return _ZSTD_TAG + len(payload).to_bytes(8, "little") + compressed
+
+    @staticmethod
+    def _decompress(raw: bytes) -> bytes:
+        if raw[:1] != _ZSTD_TAG:
+            return raw
+        size = int.from_bytes(raw[1:9], "little")
+        return _ZSTD.decompress(raw[9:], decompressed_size=size, asbytes=True)
+
+    @staticmethod
+    def _decompress_all(raws: List) -> List:
+        """Inflate the zstd values of a batch read, in parallel when large."""
+        compressed = [
+            i
+            for i, raw in enumerate(raws)
+            if isinstance(raw, bytes) and raw[:1] == _ZSTD_TAG
+        ]
+        total = sum(len(raws[i]) for i in compressed)
+        if (
+            len(compressed) < 2
+            or total <= PARALLEL_DECOMPRESS_MIN_BYTES
+            or PARALLEL_DECOMPRESS_THREADS == 1
+        ):
+            # _loads inflates these one by one
+            return raws
+        inflated = list(raws)
+        workers = min(PARALLEL_DECOMPRESS_THREADS, len(compressed))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            results = pool.map(RedisCache._decompress, [raws[i] for i in compressed])
+            for i, raw in zip(compressed, results):
+                inflated[i] = raw
+        return inflated
+
+    @staticmethod
+    def _loads(adapter: TypeAdapter, raw: Union[bytes, str]):
+        """Validate a stored value written by :meth:`_dumps` (or legacy JSON)."""
+        if isinstance(raw, str):
+            raw = raw.encode("utf-8")
+        raw = RedisCache._decompress(raw)
+        if raw[:1] == _MSGPACK_TAG:
+            loaded = ormsgpack.unpackb(raw[1:])
+            return adapter.validate_python(RedisCache._unpack_binary_data(loaded))
+        return adapter.validate_json(raw)
+
+    @staticmethod
+    def _session_to_mapping(session: Session) -> Dict[str, str]:
+        """Flatten session metadata to HASH fields; None values are left out."""
+        fields = session.model_dump(mode="json", exclude={"messages"})
+        return {k: str(v) for k, v in fields.items() if v is not None}
+
+    @staticmethod
+    def _to_hash_value(value) -> str:
+        return value.isoformat() if isinstance(value, datetime) else str(value)
+
+    @staticmethod
+    def _session_info(session: Session) -> SessionInfo:
+        return SessionInfo(
+            sessionId=session.sessionId,
+            userId=session.userId,
+            createdAt=session.createdAt,
+            updatedAt=session.updatedAt,
+            title=session.title,
+            numMessages=session.numMessages,
+            numArtifacts=session.numArtifacts,
+        )
+
+    @staticmethod
+    def _session_from_hash(raw: Dict) -> Session:
+        fields = {
+            (k.decode("utf-8") if isinstance(k, bytes) else k): (
+                v.decode("utf-8") if isinstance(v, bytes) else v
+            )
+            for k, v in raw.items()
+        }
+        return Session.model_validate(fields)
+
+    @staticmethod
+    def _decode_message_ids(raw: List) -> List[str]:
+        # A message re-saved into the same session is pushed again; keep the first
+        # occurrence so ordering stays chronological.
+        return list(dict.fromkeys(RedisCache._decode_ids(raw)))
+
+    @staticmethod
+    def _decode_ids(raw: List) -> List[str]:
+        return [i.decode("utf-8") if isinstance(i, bytes) else i for i in raw]
+
+    @staticmethod
+    def _insertion_scores(ids: List[str]) -> Dict[str, int]:
+        # Microsecond timestamps stay exact as ZSET (double) scores; offsetting
+        # each id keeps a batch in the order given.
+        base = time.time_ns() // 1000
+        return {aid: base + i for i, aid in enumerate(ids)}
+
+    @staticmethod
+    def _may_belong_to(raw: Union[bytes, str], owner_id: Optional[str]) -> bool:
+        """Cheap pre-check run on a stored value before validating it.
+
+        JSON and MessagePack both keep string fields as plain UTF-8, so a value
+        whose bytes do not contain ``owner_id`` cannot belong to it. A match is
+        not proof; _validate_ownership still runs on the parsed model.
+        """
+        if not owner_id:
+            return True
+        if isinstance(raw, str):
+            return owner_id in raw
+        if raw[:1] == _ZSTD_TAG:
+            # Compressed: cannot tell without inflating, leave it to validation
+            return True
+        return owner_id.encode("utf-8") in raw
 
     def _validate_ownership(
         self, item: All_Objects, key_to_check: str, owner_id: Optional[str]
@@ -105,13 +517,13 @@ class RedisCache:
             # assume public access if no owner_id provided
             return True
 
-        if not hasattr(item, key_to_check):
+        item_owner = getattr(item, key_to_check, _MISSING)
+        if item_owner is _MISSING:
             logger.warning(
                 f"Key {key_to_check} not found in object for ownership validation."
             )
             return False
 
-        item_owner = getattr(item, key_to_check, None)
         if item_owner != owner_id:
             logger.warning(
                 f"Ownership validation failed for key {key_to_check}. Expected: {owner_id}, Got: {item_owner}"
@@ -121,46 +533,274 @@ class RedisCache:
 
     # --- session operations ----------------------------------------------
     def save_session(
-        self, session: Session, *, cascade: bool = True, ttl: Optional[int] = None
+        self,
+        session: Session,
+        *,
+        cascade: bool = True,
+        ttl: Optional[int] = None,
+        pipe: Optional[redis.client.Pipeline] = None,
     ) -> None:
+        """Persist a session, and with cascade its messages, artifacts and indexes.
+
+        Every write is queued on one non-transactional pipeline (``pipe`` if the
+        caller supplies one, which it then executes) and flushed in a single
+        round trip; index helpers read their current value up front.
+        """
+        own_pipe = pipe is None
+        if own_pipe:
+            pipe = self.redis.pipeline(transaction=False)
+
+        if session.messages:
+            # A fully loaded session is the source of truth for its counters
+            session.numMessages = len(session.messages)
+            session.numArtifacts = sum(
+                map(len, (m.artifacts or () for m in session.messages))
+            )
+
         key = self.k_session(session.sessionId)
-        self._set_json(key, session.model_dump_json(), ttl)
-        logger.debug(f"Saved session {session.sessionId}")
+        # Overwrite the hash and drop fields reset to None, so no DEL gap exists
+        mapping = self._session_to_mapping(session)
+        pipe.hset(key, mapping=mapping)
+        cleared = [
+            f for f in Session.model_fields if f != "messages" and f not in mapping
+        ]
+        if cleared:
+            pipe.hdel(key, *cleared)
+        pipe.expire(key, ttl or self.ttl)
 
         # Index by user
         if session.userId:
-            info = SessionInfo(
-                sessionId=session.sessionId,
-                userId=session.userId,
-                createdAt=session.createdAt,
-                updatedAt=session.updatedAt,
-                title=session.title,
-                numMessages=session.numMessages,
-                numArtifacts=sum(len(m.artifacts or []) for m in session.messages),
-            )
-            self._add_session_to_user_index(session.userId, info, ttl=ttl)
+            self._index_session(session, ttl=ttl, pipe=pipe)
 
         if cascade:
             # Persist contained messages and artifacts, and build indexes
-            for msg in session.messages:
-                # Ensure sessionId consistency
-                if msg.sessionId != session.sessionId:
-                    logger.warning(
-                        f"Message {msg.messageId} has mismatched sessionId {msg.sessionId}; correcting to {session.sessionId}"
-                    )
-                    msg.sessionId = session.sessionId
-                self.save_message(msg, cascade=True, ttl=ttl)
+            self.save_messages(session.sessionId, session.messages, ttl=ttl, pipe=pipe)
+
+        if own_pipe:
+            pipe.execute()
+        scope = _session_cache.get()
+        if scope is not None:
+            scope[key] = session.model_copy(update={"messages": []})
+        logger.debug(f"Saved session {session.sessionId}")
 
     def get_session(
         self, session_id: str, user_id: Optional[str] = None
     ) -> Optional[Session]:
-        raw = self._get_json(self.k_session(session_id))
-        if raw is None:
-            return None
-        res = Session.model_validate_json(raw)
+        key = self.k_session(session_id)
+        scope = _session_cache.get()
+        res = scope.get(key) if scope is not None else None
+        if res is None:
+            raw = self.redis.hgetall(key)
+            if not raw:
+                return None
+            res = self._session_from_hash(raw)
+            if scope is not None:
+                scope[key] = res
         if not self._validate_ownership(res, "userId", user_id):
             return None
-        return res
+        # Callers mutate and re-save sessions; never hand out the cached instance
+        return res.model_copy() if scope is not None else res
+
+    def session_exists(self, session_id: str, user_id: Optional[str] = None) -> bool:
+        """Check that a session exists (and belongs to ``user_id`` if given).
+
+        Reads a single hash field instead of loading and validating the session.
+        """
+        key = self.k_session(session_id)
+        scope = _session_cache.get()
+        if scope is not None and key in scope:
+            return self._validate_ownership(scope[key], "userId", user_id)
+        if not user_id:
+            return bool(self.redis.exists(key))
+        owner = self.redis.hget(key, "userId")
+        if owner is None:
+            return False
+        owner = owner.decode("utf-8") if isinstance(owner, bytes) else owner
+        if owner != user_id:
+            logger.warning(
+                f"Ownership validation failed for key userId. Expected: {user_id}, Got: {owner}"
+            )
+            return False
+        return True
+
+    def update_session_fields(
+        self, session_id: str, *, ttl: Optional[int] = None, **fields
+    ) -> None:
+        """Update individual session metadata fields in one round trip, without a read."""
+        key = self.k_session(session_id)
+        scope = _session_cache.get()
+        if scope is not None:
+            scope.pop(key, None)
+        to_set = {}
+        to_clear = []
+        for name, value in fields.items():
+            if value is None:
+                to_clear.append(name)
+            else:
+                to_set[name] = self._to_hash_value(value)
+        pipe = self.redis.pipeline(transaction=False)
+        if to_set:
+            pipe.hset(key, mapping=to_set)
+        if to_clear:
+            pipe.hdel(key, *to_clear)
+        pipe.expire(key, ttl or self.ttl)
+        pipe.execute()
+
+    def record_message_in_session(
+        self,
+        session: Session,
+        delta: int = 1,
+        *,
+        artifacts_delta: int = 0,
+        ttl: Optional[int] = None,
+        **fields,
+    ) -> Optional[Session]:
+        """Adjust a session's message counter by ``delta`` and update ``fields``.
+
+        numMessages (and numArtifacts, by ``artifacts_delta``) are kept with
+        HINCRBY, so nobody has to count the indexes. A script applies the
+        writes only if the session still exists, so a session deleted or
+        expired meanwhile is not recreated as a partial hash. Returns the
+        session with the new values applied (the user's session index is
+        refreshed too), or None if the session is gone.
+        """
+        stored = self._update_session_counters(
+            session.sessionId, delta, artifacts_delta, ttl=ttl, **fields
+        )
+        if stored is None:
+            return None
+        num_messages = stored["numMessages"]
+        num_artifacts = stored["numArtifacts"]
+
+        updated = session.model_copy(
+            update={
+                **fields,
+                "numMessages": max(int(num_messages), 0),
+                "numArtifacts": max(int(num_artifacts), 0),
+            }
+        )
+        if updated.userId:
+            self._index_session(updated, ttl=ttl)
+        return updated
+
+    def _update_session_counters(
+        self,
+        session_id: str,
+        delta: int,
+        artifacts_delta: int,
+        *,
+        ttl: Optional[int] = None,
+        **fields,
+    ) -> Optional[Dict]:
+        """Run RECORD_MESSAGE_SCRIPT; returns the updated hash, None if gone."""
+        key = self.k_session(session_id)
+        scope = _session_cache.get()
+        if scope is not None:
+            scope.pop(key, None)
+        args = [delta, artifacts_delta, ttl or self.ttl]
+        for k, v in fields.items():
+            args += [k, self._to_hash_value(v)]
+        raw = self._record_message_script(keys=[key], args=args)
+        if not raw:
+            logger.warning(f"Session {session_id} is gone; not updated")
+            return None
+        return dict(zip(self._decode_ids(raw[::2]), raw[1::2]))
+
+    def _record_artifacts_removed(self, session_id: str, count: int = 1) -> None:
+        """Decrement numArtifacts for artifacts removed from a session's messages.
+
+        The user's SessionInfo carries the count too, so it is rewritten.
+        """
+        stored = self._update_session_counters(session_id, 0, -count)
+        if stored is None:
+            return
+        session = self._session_from_hash(stored)
+        if session.userId:
+            self._index_session(session)
+
+    def extend_session_ttl(
+        self,
+        session_id: str,
+        user_id: Optional[str] = None,
+        *,
+        ttl: Optional[int] = None,
+    ) -> int:
+        """Keep a session alive: refresh the TTL of every key it owns.
+
+        That is the session's own keys, the user index, its messages and their
+        artifact indexes, and all message and file artifacts (with metadata
+        and payload parts), so nothing in a live session expires under it.
+        The script runs as a plain EVALSHA on the client; queued on a pipeline,
+        redis-py would add a SCRIPT EXISTS round trip. Three round trips in
+        all, plus one for artifacts stored in parts.
+
+        If ``user_id`` is given the script checks it against the session's
+        owner, and nothing is refreshed for anyone else.
+
+        Returns the number of keys whose TTL was extended (0 if the session has
+        already expired or is not owned by ``user_id``).
+        """
+        ttl = ttl or self.ttl
+        # The script only touches hash-tagged keys of one session (one slot)
+        keys = [
+            self.k_session(session_id),
+            self.k_session_info(session_id),
+            self.k_message_index_by_session(session_id),
+            self.k_file_artifact_index_by_session(session_id),
+        ]
+        res = self._extend_ttl_script(keys=keys, args=[ttl, user_id or ""])
+        if not res:
+            return 0
+        touched, raw_message_ids, raw_file_ids = res
+        touched = int(touched)
+        message_ids = self._decode_message_ids(raw_message_ids or [])
+
+        pipe = self.redis.pipeline(transaction=False)
+        if user_id:
+            pipe.expire(self.k_session_index_by_user(user_id), ttl)
+        for mid in message_ids:
+            pipe.expire(self.k_message(mid), ttl)
+            pipe.expire(self.k_artifact_index_by_message(mid), ttl)
+        for mid in message_ids:
+            pipe.zrange(self.k_artifact_index_by_message(mid), 0, -1)
+        results = pipe.execute()
+        num_expires = len(results) - len(message_ids)
+        touched += sum(bool(r) for r in results[:num_expires])
+
+        artifact_ids = self._decode_ids(raw_file_ids or []) + [
+            aid for raw in results[num_expires:] for aid in self._decode_ids(raw)
+        ]
+        return touched + self._expire_artifacts(artifact_ids, ttl)
+
+    def _expire_artifacts(self, artifact_ids: List[str], ttl: int) -> int:
+        """Refresh the TTL of artifacts, their metadata and payload parts."""
+        if not artifact_ids:
+            return 0
+        pipe = self.redis.pipeline(transaction=False)
+        for aid in artifact_ids:
+            key = self.k_artifact(aid)
+            pipe.expire(key, ttl)
+            pipe.expire(self.k_artifact_meta(aid), ttl)
+            # Parts manifests are found the same way _artifact_keys finds them
+            pipe.getrange(key, 0, _MANIFEST_PROBE_BYTES - 1)
+        results = pipe.execute()
+
+        touched = 0
+        part_keys = []
+        for i, aid in enumerate(artifact_ids):
+            expired_artifact, expired_meta, head = results[3 * i : 3 * i + 3]
+            touched += bool(expired_artifact) + bool(expired_meta)
+            manifest = self._parts_manifest(head)
+            if manifest is not None:
+                part_keys += [
+                    self.k_artifact_part(aid, n) for n in range(manifest["__parts__"])
+                ]
+        if part_keys:
+            pipe = self.redis.pipeline(transaction=False)
+            for key in part_keys:
+                pipe.expire(key, ttl)
+            touched += sum(bool(r) for r in pipe.execute())
+        return touched
 
     def delete_session(
         self, session_id: str, user_id: Optional[str] = None, *, cascade: bool = False
@@ -169,74 +809,163 @@ class RedisCache:
 
         Returns number of keys removed from Redis (best-effort count).
         """
-        deleted = 0
-        session = self.get_session(session_id, user_id=user_id) if cascade else None
-
-        # Check ownership before deletion even in non-cascade mode
+        # The ownership check, the index reads and the deletion of the
+        # session's own keys run atomically in one script on the session's
+        # slot, so no writer can slip in between check and delete.
+        session_keys = [
+            self.k_session(session_id),
+            self.k_session_info(session_id),
+            self.k_message_index_by_session(session_id),
+            self.k_file_artifact_index_by_session(session_id),
+        ]
+        scope = _session_cache.get()
+        if scope is not None:
+            scope.pop(session_keys[0], None)
+        res = self._delete_session_script(
+            keys=session_keys, args=[user_id or "", "1" if cascade else "0"]
+        )
+        if res is None:
+            logger.warning(f"Session {session_id} not found or not owned by {user_id}")
+            return 0
+        owner, deleted, raw_msg_ids, raw_file_ids = res
         if not cascade:
-            session = self.get_session(session_id, user_id=user_id)
-            if session is None:
-                return 0
-
-        if cascade and session is not None:
-            # Remove session from user index
-            if session.userId:
-                self._remove_session_from_user_index(session.userId, session.sessionId)
-
-            # Remove indexed messages and artifacts
-            msg_ids = self.get_message_ids_for_session(session_id) or []
-            for mid in msg_ids:
-                deleted += self.delete_message(mid, session_id=session_id, cascade=True)
-            # Clear the message index key itself
-            deleted += int(
-                self.redis.delete(self.k_message_index_by_session(session_id))
-            )
+            return int(deleted)
 
-            # Remove file artifacts from session and clean up the index
-            file_artifact_ids = self.get_file_artifact_ids_for_session(session_id) or []
-            for aid in file_artifact_ids:
-                deleted += self.delete_artifact(aid)
-            # Clear the file artifact index key itself
-            deleted += int(
-                self.redis.delete(self.k_file_artifact_index_by_session(session_id))
-            )
-
-        # Delete the session key
-        deleted += int(self.redis.delete(self.k_session(session_id)))
-        return deleted
+        # Messages and artifacts live in other slots; they go in one pipeline.
+        # Messages in the session's own index need no per-message ownership check
+        cascade_keys = self._cascade_keys(
+            self._decode_message_ids(raw_msg_ids), self._decode_ids(raw_file_ids)
+        )
+        pipe = self.redis.pipeline(transaction=False)
+        if owner:
+            owner = owner.decode("utf-8") if isinstance(owner, bytes) else owner
+            self._remove_session_from_user_index(owner, session_id, pipe=pipe)
+        num_unlinks = self._queue_unlink(pipe, cascade_keys)
+        results = pipe.execute()
+        # Only the UNLINK replies (the last ones) count removed keys
+        return int(deleted) + sum(int(r) for r in results[len(results) - num_unlinks :])
 
     # --- message operations ----------------------------------------------
     def save_message(
-        self, message: Message, *, cascade: bool = True, ttl: Optional[int] = None
+        self,
+        message: Message,
+        *,
+        cascade: bool = True,
+        ttl: Optional[int] = None,
+        pipe: Optional[redis.client.Pipeline] = None,
+        skip_index: bool = False,
     ) -> None:
+        """Persist a message (and with cascade its artifacts and their index).
+
+        ``skip_index`` leaves the session's message index alone, for callers
+        such as :meth:`save_session` that index many messages in one write.
+        """
+        own_pipe = pipe is None
+        if own_pipe:
+            pipe = self.redis.pipeline(transaction=False)
+
         key = self.k_message(message.messageId)
-        self._set_json(key, message.model_dump_json(), ttl)
-        logger.debug(f"Saved message {message.messageId}")
+        self._set_bytes(key, self._dumps(message), ttl, pipe=pipe)
 
         # Index message under session
-        self._add_message_to_session_index(
-            message.sessionId, message.messageId, ttl=ttl
-        )
+        if not skip_index:
+            self._add_message_to_session_index(
+                message.sessionId, message.messageId, ttl=ttl, pipe=pipe
+            )
 
         if cascade and message.artifacts:
             for art in message.artifacts:
                 logger.debug(f"Cascade saving artifact {art.artifactId}")
-                self.save_artifact(art, ttl=ttl)
-                self._add_artifact_to_message_index(
-                    message.messageId, art.artifactId, ttl=ttl
+                self.save_artifact(art, ttl=ttl, pipe=pipe)
+            # One index write for all artifacts: queued writes are not visible
+            # to a later read-modify-write on the same key
+            self._add_artifacts_to_message_index(
+                message.messageId,
+                [a.artifactId for a in message.artifacts],
+                ttl=ttl,
+                pipe=pipe,
+            )
+
+        if own_pipe:
+            pipe.execute()
+        logger.debug(f"Saved message {message.messageId}")
+
+    def save_messages(
+        self,
+        session_id: str,
+        messages: List[Message],
+        *,
+        ttl: Optional[int] = None,
+        pipe: Optional[redis.client.Pipeline] = None,
+    ) -> None:
+        """Persist several messages of one session, with their artifacts.
+
+        Everything, including a single RPUSH of all ids onto the session's
+        message index, goes out in one pipeline round trip.
+        """
+        own_pipe = pipe is None
+        if own_pipe:
+            pipe = self.redis.pipeline(transaction=False)
+        for msg in messages:
+            # Ensure sessionId consistency
+            if msg.sessionId != session_id:
+                logger.warning(
+                    f"Message {msg.messageId} has mismatched sessionId {msg.sessionId}; correcting to {session_id}"
                 )
+                msg.sessionId = session_id
+            self.save_message(msg, cascade=True, ttl=ttl, pipe=pipe, skip_index=True)
+        # One RPUSH for every message id instead of one per message
+        self._add_messages_to_session_index(
+            session_id, [msg.messageId for msg in messages], ttl=ttl, pipe=pipe
+        )
+        if own_pipe:
+            pipe.execute()
 
     def get_message(
         self, message_id: str, session_id: Optional[str] = None
     ) -> Optional[Message]:
-        raw = self._get_json(self.k_message(message_id))
+        raw = self.redis.get(self.k_message(message_id))
         if raw is None:
             return None
-        res = Message.model_validate_json(raw)
+        if not self._may_belong_to(raw, session_id):
+            logger.warning(f"Message {message_id} does not belong to {session_id}")
+            return None
+        res = self._loads(_MESSAGE_TA, raw)
         if not self._validate_ownership(res, "sessionId", session_id):
             return None
         return res
 
+    def get_messages(
+        self, message_ids: List[str], session_id: Optional[str] = None
+    ) -> List[Optional[Message]]:
+        """Batch-fetch messages with a single MGET.
+
+        The result is aligned with ``message_ids``; missing or unparsable
+        messages and those outside ``session_id`` come back as None.
+        """
+        if not message_ids:
+            return []
+        raws = self.redis.mget([self.k_message(mid) for mid in message_ids])
+        adapter = _MESSAGE_TA
+        messages: List[Optional[Message]] = []
+        for message_id, raw in zip(message_ids, raws):
+            message = None
+            if raw is None:
+                logger.warning(f"Message {message_id} not found in Redis")
+            elif not self._may_belong_to(raw, session_id):
+                logger.warning(f"Message {message_id} does not belong to {session_id}")
+            else:
+                try:
+                    message = self._loads(adapter, raw)
+                except Exception as e:
+                    logger.error(f"Failed to parse message {message_id}: {str(e)}")
+            if message is not None and not self._validate_ownership(
+                message, "sessionId", session_id
+            ):
+                message = None
+            messages.append(message)
+        return messages
+
     def delete_message(
         self,
         message_id: str,
@@ -244,44 +973,219 @@ class RedisCache:
         *,
         cascade: bool = False,
     ) -> int:
-        deleted = 0
-        msg = self.get_message(message_id, session_id=session_id) if cascade else None
+        # Check ownership before deletion, cascading or not
+        msg = self.get_message(message_id, session_id=session_id)
+        if msg is None:
+            return 0
+        return self._delete_message_with_obj(msg, cascade=cascade)
 
-        # Check ownership before deletion even in non-cascade mode
+    def _delete_message_with_obj(self, msg: Message, *, cascade: bool = False) -> int:
+        """Delete an already fetched (and ownership-checked) message."""
         if not cascade:
-            msg = self.get_message(message_id, session_id=session_id)
-            if msg is None:
-                return 0
-
-        if cascade and msg is not None:
-            # Remove messageId from its session index
-            self._remove_message_from_session_index(msg.sessionId, message_id)
-            # Remove artifacts
-            art_ids = self.get_artifact_ids_for_message(message_id) or []
-            for aid in art_ids:
-                deleted += self.delete_artifact(aid, message_id=message_id)
-            # Clear artifact index key
-            deleted += int(
-                self.redis.delete(self.k_artifact_index_by_message(message_id))
-            )
-
-        deleted += int(self.redis.delete(self.k_message(message_id)))
-        return deleted
+            return int(self.redis.delete(self.k_message(msg.messageId)))
+        keys = self._cascade_keys([msg.messageId])
+        # Unindexing and every DEL go out together
+        pipe = self.redis.pipeline(transaction=False)
+        self._remove_message_from_session_index(msg.sessionId, msg.messageId, pipe=pipe)
+        num_unlinks = self._queue_unlink(pipe, keys)
+        return sum(int(r) for r in pipe.execute()[-num_unlinks:])
+
+    @staticmethod
+    def _queue_unlink(pipe: redis.client.Pipeline, keys: List[str]) -> int:
+        """Queue UNLINKs for ``keys`` in chunks; returns the number queued."""
+        for start in range(0, len(keys), UNLINK_CHUNK_KEYS):
+            pipe.unlink(*keys[start : start + UNLINK_CHUNK_KEYS])
+        return -(-len(keys) // UNLINK_CHUNK_KEYS)
+
+    def _cascade_keys(
+        self, message_ids: List[str], artifact_ids: Optional[List[str]] = None
+    ) -> List[str]:
+        """Every key owned by ``message_ids`` plus the given extra artifacts.
+
+        That is the messages, their artifact indexes, and all artifacts with
+        their payload parts. Every artifact index is read in one pipeline and
+        every artifact is checked for parts with one MGET, so callers can
+        delete the lot in a single DEL.
+        """
+        index_keys = [self.k_artifact_index_by_message(m) for m in message_ids]
+        artifact_ids = list(artifact_ids or [])
+        if index_keys:
+            pipe = self.redis.pipeline(transaction=False)
+            for key in index_keys:
+                pipe.zrange(key, 0, -1)
+            artifact_ids += [
+                aid for raw in pipe.execute() for aid in self._decode_ids(raw)
+            ]
+        message_keys = [self.k_message(m) for m in message_ids]
+        return message_keys + index_keys + self._artifact_keys(artifact_ids)
 
     # --- artifact operations ---------------------------------------------
-    def save_artifact(self, artifact: Artifact, *, ttl: Optional[int] = None) -> None:
+    def save_artifact(
+        self,
+        artifact: Artifact,
+        *,
+        ttl: Optional[int] = None,
+        pipe: Optional[redis.client.Pipeline] = None,
+    ) -> None:
         key = self.k_artifact(artifact.artifactId)
-        # Artifact is a Union type; .json() works on actual instance
-        self._set_json(key, artifact.model_dump_json(), ttl)
+        # Artifact is a Union type; serialization works on the actual instance
+        payload = self._dumps(artifact)
+        ttl = ttl or self.ttl
+        chunked = len(payload) > ARTIFACT_CHUNK_BYTES
+        # A previous save may have used more parts; the probe reads only the
+        # head of the old value, the way _expire_artifacts finds manifests
+        old_manifest = self._parts_manifest(
+            self.redis.getrange(key, 0, _MANIFEST_PROBE_BYTES - 1)
+        )
+        own_pipe = pipe is None
+        if own_pipe:
+            pipe = self.redis.pipeline(transaction=chunked)
+        num_parts = 0
+        if not chunked:
+            pipe.setex(key, ttl, payload)
+        else:
+            parts = [
+                payload[i : i + ARTIFACT_CHUNK_BYTES]
+                for i in range(0, len(payload), ARTIFACT_CHUNK_BYTES)
+            ]
+            for i, part in enumerate(parts):
+                pipe.setex(self.k_artifact_part(artifact.artifactId, i), ttl, part)
+            # The manifest goes last so readers never see it before its parts
+            num_parts = len(parts)
+            manifest = {"__parts__": num_parts, "size": len(payload)}
+            pipe.setex(key, ttl, json.dumps(manifest))
+        if old_manifest is not None and old_manifest["__parts__"] > num_parts:
+            # Parts past the new manifest would otherwise linger until expiry
+            pipe.unlink(
+                *(
+                    self.k_artifact_part(artifact.artifactId, n)
+                    for n in range(num_parts, old_manifest["__parts__"])
+                )
+            )
+        # Small fields as a hash, so metadata reads never pull the payload.
+        # Replaced wholesale: fields now None must not survive a re-save.
+        meta_key = self.k_artifact_meta(artifact.artifactId)
+        meta = artifact.model_dump(
+            mode="json", exclude=_ARTIFACT_META_EXCLUDE, exclude_none=True
+        )
+        pipe.delete(meta_key)
+        pipe.hset(meta_key, mapping={k: json.dumps(v) for k, v in meta.items()})
+        pipe.expire(meta_key, ttl)
+        if own_pipe:
+            pipe.execute()
         logger.debug(f"Saved artifact {artifact.artifactId}")
 
+    def save_artifact_with_index(
+        self,
+        artifact: Artifact,
+        message_id: Optional[str] = None,
+        *,
+        ttl: Optional[int] = None,
+    ) -> bool:
+        """Save an artifact and add it to ``message_id``'s index in one round trip.
+
+        Returns True if the artifact was newly added to the index (False if it
+        was already indexed, or no message was given).
+        """
+        pipe = self.redis.pipeline(transaction=False)
+        self.save_artifact(artifact, ttl=ttl, pipe=pipe)
+        if message_id:
+            self._add_artifact_to_message_index(
+                message_id, artifact.artifactId, ttl=ttl, pipe=pipe
+            )
+        results = pipe.execute()
+        # The index write is the ZADD NX followed by its EXPIRE
+        return bool(message_id) and results[-2] == 1
+
+    @staticmethod
+    def _parts_manifest(raw) -> Optional[Dict]:
+        if isinstance(raw, str):
+            raw = raw.encode("utf-8")
+        if raw and raw.startswith(_PARTS_MANIFEST_PREFIX):
+            return json.loads(raw)
+        return None
+
+    def _join_artifact_parts(self, artifact_ids: List[str], raws: List) -> List:
+        """Replace parts manifests in ``raws`` with the reassembled payloads.
+
+        All parts of all chunked artifacts are fetched in one pipeline.
+        """
+        manifests = {}
+        for i, raw in enumerate(raws):
+            manifest = self._parts_manifest(raw)
+            if manifest is not None:
+                manifests[i] = manifest
+        if not manifests:
+            return raws
+
+        pipe = self.redis.pipeline(transaction=False)
+        for i, manifest in manifests.items():
+            for part in range(manifest["__parts__"]):
+                pipe.get(self.k_artifact_part(artifact_ids[i], part))
+        fetched = iter(pipe.execute())
+
+        joined = list(raws)
+        for i, manifest in manifests.items():
+            parts = [next(fetched) for _ in range(manifest["__parts__"])]
+            if any(p is None for p in parts):
+                logger.warning(f"Artifact {artifact_ids[i]} is missing parts")
+                joined[i] = None
+            else:
+                joined[i] = b"".join(parts)
+        return joined
+
+    def get_artifacts(self, artifact_ids: List[str]) -> Dict[str, Artifact]:
+        """Batch-fetch artifacts (MGET plus one pipeline for chunked ones).
+
+        Returns a dict of artifact_id -> Artifact; missing or unparsable
+        artifacts are left out.
+        """
+        if not artifact_ids:
+            return {}
+        raws = self.redis.mget([self.k_artifact(aid) for aid in artifact_ids])
+        raws = self._decompress_all(self._join_artifact_parts(artifact_ids, raws))
+
+        adapter = _ARTIFACT_TA
+        artifacts: Dict[str, Artifact] = {}
+        for artifact_id, raw in zip(artifact_ids, raws):
+            if raw is None:
+                logger.warning(f"Artifact {artifact_id} not found in Redis")
+                continue
+            try:
+                artifacts[artifact_id] = self._loads(adapter, raw)
+            except Exception as e:
+                logger.error(f"Failed to parse artifact {artifact_id}: {str(e)}")
+        return artifacts
+
+    def get_artifacts_metadata(
+        self, artifact_ids: List[str]
+    ) -> Dict[str, Dict[str, Any]]:
+        """Batch-fetch artifact metadata (every field but data/thumbnail_data).
+
+        One pipelined HGETALL per artifact; payloads are never read. Artifacts
+        without a metadata hash (missing, or saved before it existed) are
+        left out.
+        """
+        if not artifact_ids:
+            return {}
+        pipe = self.redis.pipeline(transaction=False)
+        for aid in artifact_ids:
+            pipe.hgetall(self.k_artifact_meta(aid))
+        metadata: Dict[str, Dict[str, Any]] = {}
+        for artifact_id, raw in zip(artifact_ids, pipe.execute()):
+            if raw:
+                metadata[artifact_id] = {
+                    (k.decode("utf-8") if isinstance(k, bytes) else k): json.loads(v)
+                    for k, v in raw.items()
+                }
+        return metadata
+
     def get_artifact(
         self, artifact_id: str, message_id: Optional[str] = None
     ) -> Optional[Artifact]:
-        raw = self._get_json(self.k_artifact(artifact_id))
-        if not raw:
+        res = self.get_artifacts([artifact_id]).get(artifact_id)
+        if res is None:
             return None
-        res = TypeAdapter(Artifact).validate_json(raw)
 
         # For artifacts, we validate ownership through the message ownership chain
         if message_id is not None:
@@ -295,136 +1199,245 @@ class RedisCache:
 
         return res
 
+    def _artifact_keys(self, artifact_ids: List[str]) -> List[str]:
+        """Keys of artifacts, their metadata and any payload parts."""
+        if not artifact_ids:
+            return []
+        keys = [self.k_artifact(aid) for aid in artifact_ids]
+        meta_keys = [self.k_artifact_meta(aid) for aid in artifact_ids]
+        pipe = self.redis.pipeline(transaction=False)
+        for key in keys:
+            pipe.getrange(key, 0, _MANIFEST_PROBE_BYTES - 1)
+        part_keys = []
+        for artifact_id, raw in zip(artifact_ids, pipe.execute()):
+            manifest = self._parts_manifest(raw)
+            if manifest is not None:
+                part_keys += [
+                    self.k_artifact_part(artifact_id, i)
+                    for i in range(manifest["__parts__"])
+                ]
+        return keys + meta_keys + part_keys
+
+    def _delete_artifact_keys(self, artifact_ids: List[str]) -> int:
+        """Delete artifacts and any payload parts they were split into."""
+        keys = self._artifact_keys(artifact_ids)
+        if not keys:
+            return 0
+        pipe = self.redis.pipeline(transaction=False)
+        self._queue_unlink(pipe, keys)
+        return sum(int(r) for r in pipe.execute())
+
     def delete_artifact(
-        self, artifact_id: str, message_id: Optional[str] = None
+        self,
+        artifact_id: str,
+        message_id: Optional[str] = None,
+        *,
+        known_artifact_ids: Optional[Set[str]] = None,
+        session_id: Optional[str] = None,
     ) -> int:
+        """Delete an artifact, checking it belongs to ``message_id`` when given.
+
+        Callers that already hold the message's artifact ids pass them as
+        ``known_artifact_ids`` to skip re-reading the index. An artifact taken
+        off a message is also taken off its session's numArtifacts; callers
+        that know the session pass ``session_id`` to skip looking it up.
+        """
         # Validate ownership through message association
-        artifact = self.get_artifact(artifact_id, message_id=message_id)
-        if artifact is None:
-            return 0
-        # Remove from message index if message_id provided
         if message_id is not None:
+            art_ids = known_artifact_ids
+            if art_ids is None:
+                art_ids = self.get_artifact_ids_for_message(message_id)
+            if art_ids is None or artifact_id not in art_ids:
+                logger.warning(
+                    f"Artifact {artifact_id} not associated with message {message_id}"
+                )
+                return 0
+            # Remove from message index
             self._remove_artifact_from_message_index(message_id, artifact_id)
-        return int(self.redis.delete(self.k_artifact(artifact_id)))
+            if session_id is None:
+                message = self.get_message(message_id)
+                session_id = message.sessionId if message else None
+            if session_id is not None:
+                self._record_artifacts_removed(session_id)
+        return self._delete_artifact_keys([artifact_id])
 
     # --- index helpers ----------------------------------------------------
     def _add_session_to_user_index(
-        self, user_id: str, info: SessionInfo, *, ttl: Optional[int] = None
+        self,
+        user_id: str,
+        info: SessionInfo,
+        *,
+        ttl: Optional[int] = None,
+        pipe: Optional[redis.client.Pipeline] = None,
     ) -> None:
+        # Upsert is a ZADD plus one SETEX of this session's info: nothing is read
+        ttl = ttl or self.ttl
         key = self.k_session_index_by_user(user_id)
-        existing = self._get_json(key)
-        items: List[SessionInfo] = []
-        if existing:
-            try:
-                items = TypeAdapter(List[SessionInfo]).validate_json(existing)
-            except Exception:
-                logger.warning("Corrupt session index payload; resetting")
-        # Replace if same sessionId exists; else append
-        found = False
-        for i, it in enumerate(items):
-            if it.sessionId == info.sessionId:
-                items[i] = info
-                found = True
-                break
-        if not found:
-            items.append(info)
-        payload = TypeAdapter(List[SessionInfo]).dump_json(items).decode("utf-8")
-        self._set_json(key, payload, ttl)
-
-    def _remove_session_from_user_index(self, user_id: str, session_id: str) -> None:
-        key = self.k_session_index_by_user(user_id)
-        existing = self._get_json(key)
-        if not existing:
-            return
-        try:
-            items = TypeAdapter(List[SessionInfo]).validate_json(existing)
-        except Exception:
+        own_pipe = pipe is None
+        if own_pipe:
+            pipe = self.redis.pipeline(transaction=False)
+        pipe.setex(self.k_session_info(info.sessionId), ttl, self._dumps(info))
+        pipe.zadd(key, {info.sessionId: info.updatedAt.timestamp()})
+        pipe.expire(key, ttl)
+        if own_pipe:
+            pipe.execute()
+
+    def _index_session(
+        self,
+        session: Session,
+        *,
+        ttl: Optional[int] = None,
+        pipe: Optional[redis.client.Pipeline] = None,
+    ) -> None:
+        """Add ``session`` to its user's index unless it is already up to date.
+
+        A session re-saved with unchanged SessionInfo fields only has its index
+        TTLs refreshed; SessionInfo is neither rebuilt nor rewritten.
+        """
+        fingerprint = session.index_fingerprint()
+        if session._indexed_info != fingerprint:
+            self._add_session_to_user_index(
+                session.userId, self._session_info(session), ttl=ttl, pipe=pipe
+            )
+            session._indexed_info = fingerprint
             return
+        ttl = ttl or self.ttl
+        own_pipe = pipe is None
+        if own_pipe:
+            pipe = self.redis.pipeline(transaction=False)
+        pipe.expire(self.k_session_info(session.sessionId), ttl)
+        pipe.expire(self.k_session_index_by_user(session.userId), ttl)
+        if own_pipe:
+            pipe.execute()
+
+    def _remove_session_from_user_index(
+        self,
+        user_id: str,
+        session_id: str,
+        *,
+        pipe: Optional[redis.client.Pipeline] = None,
+    ) -> None:
+        key = self.k_session_index_by_user(user_id)
+        (self.redis if pipe is None else pipe).zrem(key, session_id)
 
-        items = [i for i in items if i.sessionId != session_id]
-        payload = TypeAdapter(List[SessionInfo]).dump_json(items).decode("utf-8")
-        self._set_json(key, payload)
+    def get_session_info(
+        self, session_id: str, user_id: Optional[str] = None
+    ) -> Optional[SessionInfo]:
+        """Summarise a session from its hash alone (one HGETALL).
+
+        numMessages and numArtifacts are the counters kept in the hash, so no
+        index is read or counted.
+        """
+        raw_session = self.redis.hgetall(self.k_session(session_id))
+        if not raw_session:
+            return None
+        session = self._session_from_hash(raw_session)
+        if not self._validate_ownership(session, "userId", user_id):
+            return None
+        return self._session_info(session)
 
     def get_sessions_for_user(self, user_id: str) -> Optional[List[SessionInfo]]:
-        raw = self._get_json(self.k_session_index_by_user(user_id))
-        if not raw:
+        """Return the user's sessions, most recently updated first."""
+        key = self.k_session_index_by_user(user_id)
+        session_ids = self._decode_ids(self.redis.zrevrange(key, 0, -1))
+        if not session_ids:
             return None
-        return TypeAdapter(List[SessionInfo]).validate_json(raw)
+        raws = self.redis.mget([self.k_session_info(sid) for sid in session_ids])
+        adapter = _SESSION_INFO_TA
+        infos = [self._loads(adapter, raw) for raw in raws if raw]
+        expired = [sid for sid, raw in zip(session_ids, raws) if not raw]
+        if expired:
+            self.redis.zrem(key, *expired)
+        return infos
 
     def _add_message_to_session_index(
-        self, session_id: str, message_id: str, *, ttl: Optional[int] = None
+        self,
+        session_id: str,
+        message_id: str,
+        *,
+        ttl: Optional[int] = None,
+        pipe: Optional[redis.client.Pipeline] = None,
+    ) -> None:
+        self._add_messages_to_session_index(
+            session_id, [message_id], ttl=ttl, pipe=pipe
+        )
+
+    def _add_messages_to_session_index(
+        self,
+        session_id: str,
+        message_ids: List[str],
+        *,
+        ttl: Optional[int] = None,
+        pipe: Optional[redis.client.Pipeline] = None,
     ) -> None:
+        if not message_ids:
+            return
+        # Redis LIST: append is O(1) on the wire regardless of session length
         key = self.k_message_index_by_session(session_id)
-        existing = self._get_json(key)
-        ids: List[str] = []
-        if existing:
-            try:
-                ids = json.loads(existing)
-            except Exception:
-                logger.warning("Corrupt message index payload; resetting")
-        if message_id not in ids:
-            ids.append(message_id)
-        self._set_json(key, json.dumps(ids), ttl)
+        own_pipe = pipe is None
+        if own_pipe:
+            pipe = self.redis.pipeline(transaction=False)
+        pipe.rpush(key, *message_ids)
+        pipe.expire(key, ttl or self.ttl)
+        if own_pipe:
+            pipe.execute()
 
     def _remove_message_from_session_index(
-        self, session_id: str, message_id: str
+        self,
+        session_id: str,
+        message_id: str,
+        *,
+        pipe: Optional[redis.client.Pipeline] = None,
     ) -> None:
         key = self.k_message_index_by_session(session_id)
-        existing = self._get_json(key)
-        if not existing:
-            return
-        try:
-            ids = json.loads(existing)
-        except Exception:
-            return
-        ids = [i for i in ids if i != message_id]
-        self._set_json(key, json.dumps(ids))
+        (self.redis if pipe is None else pipe).lrem(key, 0, message_id)
 
     def get_message_ids_for_session(
         self, session_id: str, user_id: Optional[str] = None
     ) -> Optional[List[str]]:
         # Validate session ownership first if user_id provided
-        if user_id is not None:
-            session = self.get_session(session_id, user_id=user_id)
-            if session is None:
-                return None
+        if user_id is not None and not self.session_exists(session_id, user_id):
+            return None
 
-        raw = self._get_json(self.k_message_index_by_session(session_id))
+        raw = self.redis.lrange(self.k_message_index_by_session(session_id), 0, -1)
         if not raw:
             return None
-        try:
-            return json.loads(raw)
-        except Exception:
-            return None
+        return self._decode_message_ids(raw)
 
     def _add_artifact_to_message_index(
-        self, message_id: str, artifact_id: str, *, ttl: Optional[int] = None
+        self,
+        message_id: str,
+        artifact_id: str,
+        *,
+        ttl: Optional[int] = None,
+        pipe: Optional[redis.client.Pipeline] = None,
+    ) -> None:
+        self._add_artifacts_to_message_index(
+            message_id, [artifact_id], ttl=ttl, pipe=pipe
+        )
+
+    def _add_artifacts_to_message_index(
+        self,
+        message_id: str,
+        artifact_ids: List[str],
+        *,
+        ttl: Optional[int] = None,
+        pipe: Optional[redis.client.Pipeline] = None,
     ) -> None:
         key = self.k_artifact_index_by_message(message_id)
-        existing = self._get_json(key)
-        ids: List[str] = []
-        if existing:
-            try:
-                ids = json.loads(existing)
-            except Exception:
-                logger.warning("Corrupt artifact index payload; resetting")
-        if artifact_id not in ids:
-            ids.append(artifact_id)
-        self._set_json(key, json.dumps(ids), ttl)
+        own_pipe = pipe is None
+        if own_pipe:
+            pipe = self.redis.pipeline(transaction=False)
+        # NX keeps the first insertion score, so re-adding never reorders
+        pipe.zadd(key, self._insertion_scores(artifact_ids), nx=True)
+        pipe.expire(key, ttl or self.ttl)
+        if own_pipe:
+            pipe.execute()
 
     def _remove_artifact_from_message_index(
         self, message_id: str, artifact_id: str
     ) -> None:
-        key = self.k_artifact_index_by_message(message_id)
-        existing = self._get_json(key)
-        if not existing:
-            return
-        try:
-            ids = json.loads(existing)
-        except Exception:
-            return
-        ids = [i for i in ids if i != artifact_id]
-        self._set_json(key, json.dumps(ids))
+        self.redis.zrem(self.k_artifact_index_by_message(message_id), artifact_id)
 
     def get_artifact_ids_for_message(
         self, message_id: str, session_id: Optional[str] = None
@@ -435,59 +1448,55 @@ class RedisCache:
             if message is None:
                 return None
 
-        raw = self._get_json(self.k_artifact_index_by_message(message_id))
+        raw = self.redis.zrange(self.k_artifact_index_by_message(message_id), 0, -1)
         if not raw:
             return None
-        try:
-            return json.loads(raw)
-        except Exception:
-            return None
+        return self._decode_ids(raw)
+
+    def get_artifact_ids_for_messages(
+        self, message_ids: List[str]
+    ) -> Dict[str, List[str]]:
+        """Read several messages' artifact indexes in one pipeline.
+
+        Messages without artifacts are left out of the result.
+        """
+        if not message_ids:
+            return {}
+        pipe = self.redis.pipeline(transaction=False)
+        for message_id in message_ids:
+            pipe.zrange(self.k_artifact_index_by_message(message_id), 0, -1)
+        return {
+            message_id: self._decode_ids(raw)
+            for message_id, raw in zip(message_ids, pipe.execute())
+            if raw
+        }
 
     def _add_file_artifact_to_session_index(
         self, session_id: str, artifact_id: str, *, ttl: Optional[int] = None
     ) -> None:
         key = self.k_file_artifact_index_by_session(session_id)
-        existing = self._get_json(key)
-        ids: List[str] = []
-        if existing:
-            try:
-                ids = json.loads(existing)
-            except Exception:
-                logger.warning("Corrupt file artifact index payload; resetting")
-        if artifact_id not in ids:
-            ids.append(artifact_id)
-        self._set_json(key, json.dumps(ids), ttl)
+        pipe = self.redis.pipeline(transaction=False)
+        pipe.zadd(key, self._insertion_scores([artifact_id]), nx=True)
+        pipe.expire(key, ttl or self.ttl)
+        pipe.execute()
 
     def _remove_file_artifact_from_session_index(
         self, session_id: str, artifact_id: str
     ) -> None:
-        key = self.k_file_artifact_index_by_session(session_id)
-        existing = self._get_json(key)
-        if not existing:
-            return
-        try:
-            ids = json.loads(existing)
-        except Exception:
-            return
-        ids = [i for i in ids if i != artifact_id]
-        self._set_json(key, json.dumps(ids))
+        self.redis.zrem(self.k_file_artifact_index_by_session(session_id), artifact_id)
 
     def get_file_artifact_ids_for_session(
         self, session_id: str, user_id: Optional[str] = None
     ) -> Optional[List[str]]:
         # Validate session ownership first if user_id provided
-        if user_id is not None:
-            session = self.get_session(session_id, user_id=user_id)
-            if session is None:
-                return None
+        if user_id is not None and not self.session_exists(session_id, user_id):
+            return None
 
-        raw = self._get_json(self.k_file_artifact_index_by_session(session_id))
+        key = self.k_file_artifact_index_by_session(session_id)
+        raw = self.redis.zrange(key, 0, -1)
         if not raw:
             return None
-        try:
-            return json.loads(raw)
-        except Exception:
-            return None
+        return self._decode_ids(raw)
 
     # --- High-level ownership validation methods ----------------------------
     def get_session_with_full_ownership(
@@ -501,12 +1510,48 @@ class RedisCache:
     ) -> Optional[Message]:
         """Get a message with full ownership chain validation (user -> session -> message)."""
         # First validate session ownership
-        session = self.get_session(session_id, user_id=user_id)
-        if session is None:
+        if not self.session_exists(session_id, user_id):
             return None
         # Then get message with session validation
         return self.get_message(message_id, session_id=session_id)
 
+    def get_message_with_artifacts(
+        self, message_id: str, session_id: str, user_id: Optional[str] = None
+    ) -> Optional[Message]:
+        """Get a message with its artifacts attached, validating the ownership chain.
+
+        The session owner, message and artifact index are read in one pipeline;
+        the artifacts follow in a single batch fetch.
+        """
+        pipe = self.redis.pipeline(transaction=False)
+        pipe.hget(self.k_session(session_id), "userId")
+        pipe.get(self.k_message(message_id))
+        pipe.zrange(self.k_artifact_index_by_message(message_id), 0, -1)
+        owner, raw_message, raw_index = pipe.execute()
+
+        if raw_message is None:
+            return None
+        if isinstance(owner, bytes):
+            owner = owner.decode("utf-8")
+        if user_id and owner != user_id:
+            logger.warning(
+                f"Ownership validation failed for key userId. Expected: {user_id}, Got: {owner}"
+            )
+            return None
+        if owner is None and not self.redis.exists(self.k_session(session_id)):
+            # Only reachable without a user_id: an unowned session must still exist
+            return None
+        if not self._may_belong_to(raw_message, session_id):
+            return None
+        message = self._loads(_MESSAGE_TA, raw_message)
+        if not self._validate_ownership(message, "sessionId", session_id):
+            return None
+
+        artifact_ids = self._decode_ids(raw_index or [])
+        found = self.get_artifacts(artifact_ids)
+        message.artifacts = [found[aid] for aid in artifact_ids if aid in found]
+        return message
+
     def get_artifact_with_full_ownership(
         self, artifact_id: str, message_id: str, session_id: str, user_id: str
     ) -> Optional[Artifact]:
@@ -532,7 +1577,7 @@ class RedisCache:
         message = self.get_message_with_full_ownership(message_id, session_id, user_id)
         if message is None:
             return 0
-        return self.delete_message(message_id, session_id=session_id, cascade=cascade)
+        return self._delete_message_with_obj(message, cascade=cascade)
 
     def delete_artifact_with_ownership(
         self, artifact_id: str, message_id: str, session_id: str, user_id: str
@@ -546,25 +1591,25 @@ class RedisCache:
             logger.info(
                 f"Artifact {artifact_id} is a file artifact; deleting artifacte and from  upload index."
             )
-            deletd_keys = int(self.redis.delete(self.k_artifact(artifact_id)))
-            remaining_file_artifacts = [
-                id_ for id_ in file_artifact_ids if id_ != artifact_id
-            ]
-            self._set_json(
-                self.k_file_artifact_index_by_session(session_id),
-                json.dumps(remaining_file_artifacts),
-            )
+            # Uploads never count towards numArtifacts (only message artifacts
+            # do), so there is no counter to take them off
+            deletd_keys = self._delete_artifact_keys([artifact_id])
+            self._remove_file_artifact_from_session_index(session_id, artifact_id)
             return deletd_keys
 
         logger.info(
             f"Artifact {artifact_id} is not a file artifact; validating through message ownership and deleting normal way."
         )
-        artifact = self.get_artifact_with_full_ownership(
-            artifact_id, message_id, session_id, user_id
-        )
-        if artifact is None:
+        message = self.get_message_with_full_ownership(message_id, session_id, user_id)
+        if message is None:
             return 0
-        return self.delete_artifact(artifact_id, message_id=message_id)
+        art_ids = self.get_artifact_ids_for_message(message_id) or []
+        return self.delete_artifact(
+            artifact_id,
+            message_id=message_id,
+            known_artifact_ids=set(art_ids),
+            session_id=session_id,
+        )
 
     # --- File artifact management methods -----------------------------------
     def add_file_artifact_to_session(
@@ -577,10 +1622,8 @@ class RedisCache:
     ) -> None:
         """Add a file artifact to a session's file artifact index with ownership validation."""
         # Validate session ownership if user_id provided
-        if user_id is not None:
-            session = self.get_session(session_id, user_id=user_id)
-            if session is None:
-                raise ValueError(f"Session {session_id} not found or access denied")
+        if user_id is not None and not self.session_exists(session_id, user_id):
+            raise ValueError(f"Session {session_id} not found or access denied")
 
         self._add_file_artifact_to_session_index(session_id, artifact_id, ttl=ttl)
 
@@ -589,10 +1632,8 @@ class RedisCache:
     ) -> None:
         """Remove a file artifact from a session's file artifact index with ownership validation."""
         # Validate session ownership if user_id provided
-        if user_id is not None:
-            session = self.get_session(session_id, user_id=user_id)
-            if session is None:
-                raise ValueError(f"Session {session_id} not found or access denied")
+        if user_id is not None and not self.session_exists(session_id, user_id):
+            raise ValueError(f"Session {session_id} not found or access denied")
 
         self._remove_file_artifact_from_session_index(session_id, artifact_id)
 
@@ -606,12 +1647,8 @@ class RedisCache:
         if artifact_ids is None:
             return None
 
-        artifacts = []
-        for artifact_id in artifact_ids:
-            artifact = self.get_artifact(artifact_id)
-            if artifact is not None:
-                artifacts.append(artifact)
-
+        found = self.get_artifacts(artifact_ids)
+        artifacts = [found[aid] for aid in artifact_ids if aid in found]
         return artifacts if artifacts else None
 
     def delete_file_artifact_with_ownership(
@@ -619,8 +1656,7 @@ class RedisCache:
     ) -> int:
         """Delete a file artifact with session ownership validation."""
         # Validate session ownership first
-        session = self.get_session(session_id, user_id=user_id)
-        if session is None:
+        if not self.session_exists(session_id, user_id):
             return 0
 
         # Check if artifact is in the session's file artifact index
@@ -628,9 +1664,10 @@ class RedisCache:
         if file_artifact_ids is None or artifact_id not in file_artifact_ids:
             return 0
 
-        # Remove from session index and delete artifact
+        # Remove from session index and delete artifact; uploads are not part
+        # of numArtifacts, so the counter is left alone
         self._remove_file_artifact_from_session_index(session_id, artifact_id)
-        return int(self.redis.delete(self.k_artifact(artifact_id)))
+        return self._delete_artifact_keys([artifact_id])
 
     def get_session_csv_artifact(
         self, session_id: str, user_id: str
@@ -642,8 +1679,16 @@ class RedisCache:
         if not file_artifact_ids:
             return None
 
-        for artifact_id in file_artifact_ids:
-            artifact = self.get_artifact(artifact_id)
+        # Pick the CSV from metadata so other uploads' payloads are not read
+        metadata = self.get_artifacts_metadata(file_artifact_ids)
+        candidates = [
+            aid
+            for aid in file_artifact_ids
+            if aid not in metadata or metadata[aid].get("type") == "csv"
+        ]
+        found = self.get_artifacts(candidates)
+        for artifact_id in candidates:
+            artifact = found.get(artifact_id)
             if artifact and artifact.type == "csv":
                 return artifact
 
@@ -653,12 +1698,10 @@ class RedisCache:
         self, session_id: str, session_type: str, user_id: Optional[str] = None
     ) -> None:
         """Set the type of a session (e.g., 'text', 'vision', 'data_analysis')."""
-        session = self.get_session(session_id, user_id=user_id)
-        if session is None:
+        if not self.session_exists(session_id, user_id):
             raise ValueError(f"Session {session_id} not found or access denied")
 
-        session.sessionType = session_type
-        self.save_session(session)
+        self.update_session_fields(session_id, sessionType=session_type)
 
     def get_session_type(
         self, session_id: str, user_id: Optional[str] = None
@@ -1,11 +1,12 @@
-"""In-memory session storage with simple TTL eviction (manual check on access)."""
+"""Helpers that build artifacts from DataFrames, images, text and code and push them to Redis."""
 
 import pandas as pd
+import pyarrow as pa
 from PIL import Image
 from typing import Optional, Union
 
 from .redis_cache import redis_cache, RedisCache
-from .files_handler import DataFrameHandler, ImageHandler
+from .files_handler import DataFrameHandler, ImageHandler, choose_image_format
 from app.utils import create_simple_logger
 from app.models.object_models import (
     CSVArtifact,
@@ -25,11 +26,11 @@ __all__ = [
 
 
 def push_csv_artifact_to_redis(
-    df: Union[pd.DataFrame, str, bytes],
+    df: Union[pd.DataFrame, pa.Table, str, bytes],
     cache: RedisCache = redis_cache,
     message_id: Optional[str] = None,
     description: Optional[str] = None,
-    compression: Optional[str] = "gzip",
+    compression: Optional[str] = "zstd",
 ) -> CSVArtifact:
     """Process and store a CSV artifact in Redis.
 
@@ -41,20 +42,16 @@ def push_csv_artifact_to_redis(
         CSVArtifact: The updated CSV artifact with the URL set if applicable.
     """
     handler = DataFrameHandler(data=df, compression=compression)
-    pandas_df = handler.get_python_friendly_format()
+    num_rows, num_columns = handler.shape
     artifact = CSVArtifact(
         data=handler.get_base64_representation(),
         type="csv",
         description=description or f"CSV Artifact for message {message_id}",
-        num_rows=len(pandas_df) if pandas_df is not None else 0,
-        num_columns=len(pandas_df.columns) if pandas_df is not None else 0,
+        num_rows=num_rows,
+        num_columns=num_columns,
     )
 
-    cache.save_artifact(artifact)
-    if message_id:
-        cache._add_artifact_to_message_index(
-            message_id=message_id, artifact_id=artifact.artifactId
-        )
+    cache.save_artifact_with_index(artifact, message_id)
 
     return artifact
 
@@ -66,38 +63,38 @@ def push_image_artifact_to_redis(
     description: Optional[str] = None,
     alt_text: Optional[str] = None,
     compression: Optional[str] = None,
+    lossless: bool = False,
 ) -> ImageArtifact:
     """Process and store an Image artifact in Redis.
 
+    Photos (JPEG/WebP sources) are stored as lossy WebP; other images as PNG.
+
     Args:
         image (Union[Image.Image, str, bytes]): The image to be processed and stored.
         cache (RedisCache): The Redis cache instance for storage.
         message_id (Optional[str]): The ID of the message to associate the artifact with.
+        lossless (bool): Always store PNG, even for photos.
 
     Returns:
         ImageArtifact: The updated Image artifact with the URL set if applicable.
     """
     handler = ImageHandler(data=image, compression=compression)
-    pil_image = handler.get_python_friendly_format()
-    thumbnail_data = (
-        handler.get_thumbnail_base64(size=(128, 128)) if pil_image else None
-    )
+    image_format = choose_image_format(handler.image, lossless=lossless)
+    handler.image_format = image_format
+    width, height = handler.get_python_friendly_format().size
+    data, thumbnail_data = handler.get_full_and_thumbnail(size=(128, 128))
     artifact = ImageArtifact(
-        data=handler.get_base64_representation(),
+        data=data,
         type="image",
         description=description or f"Image Artifact for message {message_id}",
-        width=pil_image.width if pil_image is not None else 0,
-        height=pil_image.height if pil_image is not None else 0,
+        width=width,
+        height=height,
         thumbnail_data=thumbnail_data,
-        format=handler.image_format.lower() if pil_image is not None else "png",
+        format=image_format,
         alt_text=alt_text,
     )
 
-    cache.save_artifact(artifact)
-    if message_id:
-        cache._add_artifact_to_message_index(
-            message_id=message_id, artifact_id=artifact.artifactId
-        )
+    cache.save_artifact_with_index(artifact, message_id)
     return artifact
 
 
@@ -124,11 +121,7 @@ def push_text_artifact_to_redis(
         length=len(text),
     )
 
-    cache.save_artifact(artifact)
-    if message_id:
-        cache._add_artifact_to_message_index(
-            message_id=message_id, artifact_id=artifact.artifactId
-        )
+    cache.save_artifact_with_index(artifact, message_id)
     return artifact
 
 
@@ -159,9 +152,5 @@ def push_code_artifact_to_redis(
         language=language,
     )
 
-    cache.save_artifact(artifact)
-    if message_id:
-        cache._add_artifact_to_message_index(
-            message_id=message_id, artifact_id=artifact.artifactId
-        )
+    cache.save_artifact_with_index(artifact, message_id)
     return artifact
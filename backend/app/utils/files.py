@@ -7,4 +7,4 @@ def load_csv(buffer) -> pd.DataFrame:
 
 
 def convert_bytes_to_base64(image_bytes: bytes) -> str:
-    return base64.b64encode(image_bytes).decode("utf-8")
+    return base64.b64encode(image_bytes).decode("ascii")
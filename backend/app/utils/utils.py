@@ -1,6 +1,8 @@
 from dotenv import load_dotenv
 import logging
 import os
+from functools import lru_cache
+from types import MappingProxyType
 
 load_dotenv()
 
@@ -10,6 +12,21 @@ BROWN = "\033[0;33m"
 ITALIC = "\033[3m"
 LOG_LEVEL = os.getenv("LOG_LEVEL", "warning").upper()
 MATPLOTLIB_COLOR_MODE = os.getenv("MATPLOTLIB_COLOR_MODE", "light").lower()
+_LEVEL_MAP = MappingProxyType(
+    {
+        "debug": logging.DEBUG,
+        "info": logging.INFO,
+        "warning": logging.WARNING,
+        "error": logging.ERROR,
+        "critical": logging.CRITICAL,
+    }
+)
+# Loggers made by create_simple_logger, so level changes skip foreign loggers
+_LOCAL_LOGGERS = {}
+_FORMATTER = logging.Formatter(
+    "%(asctime)s - %(name)s - %(levelname)s - %(funcName)s:%(lineno)d - %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S",
+)
 
 
 def set_logger_level_to_all_local(level: int) -> None:
@@ -20,20 +37,15 @@ def set_logger_level_to_all_local(level: int) -> None:
     level : int, optional
         The level to set the loggers to, by default logging.DEBUG.
     """
-    level_to_int_map = {
-        "debug": logging.DEBUG,
-        "info": logging.INFO,
-        "warning": logging.WARNING,
-        "error": logging.ERROR,
-        "critical": logging.CRITICAL,
-    }
     if isinstance(level, str):
-        level = level_to_int_map[level.lower()]
+        level = _LEVEL_MAP[level.lower()]
 
-    for _, logger in logging.Logger.manager.loggerDict.items():
-        if isinstance(logger, logging.Logger):
-            if hasattr(logger, "local"):
-                logger.setLevel(level)
+    for logger in _LOCAL_LOGGERS.values():
+        logger.setLevel(level)
+        # The console handler filters too; without this, lowering the level
+        # would have no visible effect
+        for handler in logger.handlers:
+            handler.setLevel(level)
 
 
 def create_simple_logger(
@@ -53,30 +65,21 @@ def create_simple_logger(
     logging.Logger
         The logger object.
     """
-    level_to_int_map = {
-        "debug": logging.DEBUG,
-        "info": logging.INFO,
-        "warning": logging.WARNING,
-        "error": logging.ERROR,
-        "critical": logging.CRITICAL,
-    }
     if isinstance(level, str):
-        level = level_to_int_map[level.lower()]
+        level = _LEVEL_MAP[level.lower()]
     logger = logging.getLogger(logger_name)
     logger.local = True
+    _LOCAL_LOGGERS[logger_name] = logger
     logger.setLevel(level)
-    formatter = logging.Formatter(
-        "%(asctime)s - %(name)s - %(levelname)s - %(funcName)s:%(lineno)d - %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S",
-    )
-    # remove any existing handlers
-    if logger.hasHandlers():
+    # Reuse the console handler from an earlier call instead of rebuilding it
+    handler = next((h for h in logger.handlers if h.formatter is _FORMATTER), None)
+    if handler is None or len(logger.handlers) > 1:
+        # remove any existing handlers
         logger.handlers.clear()
-
-    handler = logging.StreamHandler()
+        handler = logging.StreamHandler()
+        handler.setFormatter(_FORMATTER)
+        logger.addHandler(handler)
     handler.setLevel(level)
-    handler.setFormatter(formatter)
-    logger.addHandler(handler)
     if set_level_to_all_loggers:
         set_logger_level_to_all_local(level)
     return logger
@@ -85,15 +88,14 @@ def create_simple_logger(
 logger = create_simple_logger(__name__)
 
 
-def set_publish_matplotlib_template(mode: str = MATPLOTLIB_COLOR_MODE) -> None:
-    """Sets the matplotlib template for publication-ready plots."""
-    import matplotlib.pyplot as plt
-
+@lru_cache(maxsize=2)
+def _publish_rcparams(mode: str) -> MappingProxyType:
+    """Build the read-only rcParams for the given color mode (once per mode)."""
     text_color = "black" if mode == "light" else "white"
     background_color = "white" if mode == "light" else "black"
     grid_color = "#948b72" if mode == "light" else "#666666"
 
-    plt.rcParams.update(
+    return MappingProxyType(
         {
             "font.size": 18,
             "axes.labelcolor": text_color,
@@ -120,4 +122,11 @@ def set_publish_matplotlib_template(mode: str = MATPLOTLIB_COLOR_MODE) -> None:
             "legend.labelcolor": text_color,
         }
     )
+
+
+def set_publish_matplotlib_template(mode: str = MATPLOTLIB_COLOR_MODE) -> None:
+    """Sets the matplotlib template for publication-ready plots."""
+    import matplotlib.pyplot as plt
+
+    plt.rcParams.update(_publish_rcparams(mode))
     logger.info(f"Matplotlib template ready for publication {mode} mode.")
@@ -1,5 +1,6 @@
 import pytest
 import sys
+from contextlib import contextmanager
 from pathlib import Path
 
 # Ensure 'backend' is on sys.path so 'app' package is importable in tests
@@ -9,28 +10,284 @@ if str(BACKEND_DIR) not in sys.path:
     sys.path.insert(0, str(BACKEND_DIR))
 
 
+def _to_bytes(value):
+    # emulate redis returning bytes on get
+    if isinstance(value, str):
+        return value.encode("utf-8")
+    if isinstance(value, (int, float)):
+        return str(value).encode("utf-8")
+    return value
+
+
+class FakePipeline:
+    """Queues calls against a FakeRedis and runs them in order on execute()."""
+
+    def __init__(self, redis):
+        self._redis = redis
+        self._commands = []
+
+    def __getattr__(self, name):
+        method = getattr(self._redis, name)
+
+        def queue(*args, **kwargs):
+            self._commands.append((name, method, args, kwargs))
+            return self
+
+        return queue
+
+    def __len__(self):
+        return len(self._commands)
+
+    def execute(self, raise_on_error=True):
+        commands, self._commands = self._commands, []
+        if any(name == "_run_script" for name, *_ in commands):
+            # redis-py's Pipeline.execute() first checks queued scripts with
+            # SCRIPT EXISTS in a round trip of its own
+            self._redis.round_trips.append(["script_exists"])
+        self._redis.round_trips.append([name for name, *_ in commands])
+        results = []
+        with self._redis._batch():
+            for _, method, args, kwargs in commands:
+                try:
+                    results.append(method(*args, **kwargs))
+                except Exception as e:
+                    # Like redis-py: return the error in place, or raise it after
+                    # the rest
+                    results.append(e)
+        if raise_on_error:
+            for result in results:
+                if isinstance(result, Exception):
+                    raise result
+        return results
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self._commands = []
+
+
+def _emulate_extend_ttl(redis, keys, args):
+    if not redis.exists(keys[0]):
+        return None
+    if args[1] and redis.hget(keys[0], "userId") != _to_bytes(args[1]):
+        return None
+    touched = sum(bool(redis.expire(k, args[0])) for k in keys)
+    return [touched, redis.lrange(keys[2], 0, -1), redis.zrange(keys[3], 0, -1)]
+
+
+def _emulate_record_message(redis, keys, args):
+    if not redis.exists(keys[0]):
+        return None
+    redis.hincrby(keys[0], "numMessages", int(args[0]))
+    redis.hincrby(keys[0], "numArtifacts", int(args[1]))
+    if len(args) > 3:
+        redis.hset(keys[0], mapping=dict(zip(args[3::2], args[4::2])))
+    redis.expire(keys[0], args[2])
+    return [item for pair in redis.hgetall(keys[0]).items() for item in pair]
+
+
+def _emulate_delete_session(redis, keys, args):
+    if not redis.exists(keys[0]):
+        return None
+    owner = redis.hget(keys[0], "userId") or b""
+    if args[0] and owner != _to_bytes(args[0]):
+        return None
+    if args[1] != "1":
+        return [owner, redis.unlink(keys[0]), [], []]
+    message_ids = redis.lrange(keys[2], 0, -1)
+    file_ids = redis.zrange(keys[3], 0, -1)
+    return [owner, redis.unlink(*keys), message_ids, file_ids]
+
+
+# FakeRedis methods that are not commands and cost no round trip
+_LOCAL_METHODS = frozenset({"pipeline", "register_script"})
+
+
 class FakeRedis:
     def __init__(self):
         self._store = {}
+        self._ttls = {}
+        # One entry per round trip: the names of the commands sent in it
+        self.round_trips = []
+        self._busy = False
+
+    def __getattribute__(self, name):
+        attr = object.__getattribute__(self, name)
+        if name.startswith("_") or name in _LOCAL_METHODS or not callable(attr):
+            return attr
+
+        def command(*args, **kwargs):
+            # Calls made while a pipeline or script runs are part of its trip
+            if self._busy:
+                return attr(*args, **kwargs)
+            self.round_trips.append([name])
+            with self._batch():
+                return attr(*args, **kwargs)
+
+        return command
+
+    @contextmanager
+    def _batch(self):
+        busy, self._busy = self._busy, True
+        try:
+            yield
+        finally:
+            self._busy = busy
 
     # Minimal subset used by RedisCache
     def setex(self, key, ttl, value):
-        # emulate redis returning bytes on get
-        if isinstance(value, str):
-            value = value.encode("utf-8")
-        self._store[key] = value
+        self._store[key] = _to_bytes(value)
+        self._ttls[key] = ttl
 
     def get(self, key):
         return self._store.get(key)
 
+    def mget(self, keys):
+        return [self._store.get(k) for k in keys]
+
     def delete(self, *keys):
         count = 0
         for k in keys:
             if k in self._store:
                 del self._store[k]
+                self._ttls.pop(k, None)
                 count += 1
         return count
 
+    def unlink(self, *keys):
+        return self.delete(*keys)
+
+    def getrange(self, key, start, end):
+        value = self._store.get(key)
+        if value is None:
+            return b""
+        return value[start:] if end == -1 else value[start : end + 1]
+
+    def exists(self, *keys):
+        return sum(k in self._store for k in keys)
+
+    def expire(self, key, ttl):
+        if key not in self._store:
+            return False
+        self._ttls[key] = ttl
+        return True
+
+    def rpush(self, key, *values):
+        items = self._store.setdefault(key, [])
+        items.extend(_to_bytes(v) for v in values)
+        return len(items)
+
+    def lrange(self, key, start, end):
+        items = self._store.get(key, [])
+        return items[start:] if end == -1 else items[start : end + 1]
+
+    def lrem(self, key, count, value):
+        items = self._store.get(key, [])
+        value = _to_bytes(value)
+        kept = [i for i in items if i != value]
+        removed = len(items) - len(kept)
+        if kept:
+            self._store[key] = kept
+        else:
+            self._store.pop(key, None)
+        return removed
+
+    def hset(self, key, field=None, value=None, mapping=None):
+        fields = self._store.setdefault(key, {})
+        items = dict(mapping or {})
+        if field is not None:
+            items[field] = value
+        added = 0
+        for f, v in items.items():
+            f = _to_bytes(f)
+            added += f not in fields
+            fields[f] = _to_bytes(v)
+        return added
+
+    def hget(self, key, field):
+        return self._store.get(key, {}).get(_to_bytes(field))
+
+    def hgetall(self, key):
+        return dict(self._store.get(key, {}))
+
+    def hincrby(self, key, field, amount=1):
+        fields = self._store.setdefault(key, {})
+        value = int(fields.get(_to_bytes(field), 0)) + amount
+        fields[_to_bytes(field)] = _to_bytes(value)
+        return value
+
+    def hdel(self, key, *fields):
+        existing = self._store.get(key, {})
+        removed = 0
+        for f in fields:
+            removed += existing.pop(_to_bytes(f), None) is not None
+        return removed
+
+    def zadd(self, key, mapping, nx=False):
+        members = self._store.setdefault(key, {})
+        added = 0
+        for m, score in mapping.items():
+            m = _to_bytes(m)
+            if nx and m in members:
+                continue
+            added += m not in members
+            members[m] = float(score)
+        return added
+
+    def zrem(self, key, *members):
+        existing = self._store.get(key, {})
+        removed = 0
+        for m in members:
+            removed += existing.pop(_to_bytes(m), None) is not None
+        if not existing:
+            self._store.pop(key, None)
+        return removed
+
+    def zrange(self, key, start, end):
+        ordered = sorted(self._store.get(key, {}).items(), key=lambda i: (i[1], i[0]))
+        members = [m for m, _ in ordered]
+        return members[start:] if end == -1 else members[start : end + 1]
+
+    def zrevrange(self, key, start, end):
+        members = self.zrange(key, 0, -1)[::-1]
+        return members[start:] if end == -1 else members[start : end + 1]
+
+    def zcard(self, key):
+        return len(self._store.get(key, {}))
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    def register_script(self, script):
+        # Lua isn't available here; map each known script to a Python equivalent
+        from app.services.storage.redis_cache import (
+            DELETE_SESSION_SCRIPT,
+            EXTEND_TTL_SCRIPT,
+            RECORD_MESSAGE_SCRIPT,
+        )
+
+        emulations = {
+            EXTEND_TTL_SCRIPT: _emulate_extend_ttl,
+            DELETE_SESSION_SCRIPT: _emulate_delete_session,
+            RECORD_MESSAGE_SCRIPT: _emulate_record_message,
+        }
+        handler = emulations[script]
+
+        def run(keys=(), args=(), client=None):
+            # A FakePipeline queues this like any other command; an empty
+            # pipeline is falsy, so test for None
+            if client is not None:
+                return client._run_script(handler, list(keys), list(args))
+            self.round_trips.append(["evalsha"])
+            with self._batch():
+                return self._run_script(handler, list(keys), list(args))
+
+        return run
+
+    def _run_script(self, handler, keys, args):
+        return handler(self, keys, args)
+
 
 @pytest.fixture()
 def fake_redis():
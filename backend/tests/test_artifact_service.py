@@ -324,10 +324,10 @@ class TestArtifactService:
             artifactId="artifact_2", type="text", data="Text 2"
         )
 
-        mock_cache.get_artifact_with_full_ownership.side_effect = [
-            mock_artifact_1,
-            mock_artifact_2,
-        ]
+        mock_cache.get_artifacts.return_value = {
+            "artifact_1": mock_artifact_1,
+            "artifact_2": mock_artifact_2,
+        }
 
         # Execute
         result = await artifact_service.get_artifacts_for_message(
@@ -338,6 +338,7 @@ class TestArtifactService:
         assert len(result) == 2
         assert result[0].artifactId == "artifact_1"
         assert result[1].artifactId == "artifact_2"
+        mock_cache.get_artifacts.assert_called_once_with(["artifact_1", "artifact_2"])
 
     @pytest.mark.asyncio
     async def test_update_artifact_description_success(
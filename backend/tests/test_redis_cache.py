@@ -1,7 +1,20 @@
+import os
+import sys
+import asyncio
+import base64
+import copy
+import pytest
 from typing import List
 
-from app.services.storage.redis_cache import RedisCache
-from app.models.object_models import Session, Message, TextArtifact, SessionInfo
+from app.services.storage.redis_cache import RedisCache, session_cache_scope
+from app.models.object_models import (
+    CSVArtifact,
+    ImageArtifact,
+    Message,
+    Session,
+    SessionInfo,
+    TextArtifact,
+)
 
 
 def test_save_and_get_artifact(cache: RedisCache):
@@ -160,3 +173,686 @@ def test_ownership_validation(cache: RedisCache):
     assert (
         cache.delete_session_with_ownership(s1.sessionId, "user1") > 0
     )  # Should succeed
+
+
+def test_update_session_fields(cache: RedisCache):
+    s = Session(userId="userZ", title="Before")
+    cache.save_session(s, cascade=False)
+
+    cache.update_session_fields(s.sessionId, sessionType="image", title=None)
+
+    s2 = cache.get_session(s.sessionId, user_id="userZ")
+    assert s2 is not None
+    assert s2.sessionType == "image"
+    assert s2.title is None
+    assert s2.createdAt == s.createdAt
+
+
+def test_session_cache_scope(cache: RedisCache, fake_redis):
+    s = Session(userId="userC", title="Cached")
+    cache.save_session(s, cascade=False)
+
+    with session_cache_scope():
+        first = cache.get_session(s.sessionId, user_id="userC")
+        # A stale read from the request cache proves Redis was not hit again
+        fake_redis.delete(cache.k_session(s.sessionId))
+        second = cache.get_session(s.sessionId, user_id="userC")
+        assert second is not None and second is not first
+        assert cache.get_session(s.sessionId, user_id="other") is None
+
+        cache.update_session_fields(s.sessionId, title="Changed")
+        assert cache.get_session(s.sessionId).title == "Changed"
+
+    # Outside a scope every read goes to Redis
+    fake_redis.delete(cache.k_session(s.sessionId))
+    assert cache.get_session(s.sessionId) is None
+
+
+def test_extend_session_ttl(cache: RedisCache):
+    s = Session(userId="userT", title="Alive")
+    m = Message(sessionId=s.sessionId, role="user", content="hi")
+    s.messages.append(m)
+    cache.save_session(s)
+
+    # session hash, session info, message index, user index and the message
+    # exist; no file index or artifacts yet
+    assert cache.extend_session_ttl(s.sessionId, "userT") == 5
+    assert cache.extend_session_ttl("session_missing") == 0
+    # Someone else's session is left alone
+    assert cache.extend_session_ttl(s.sessionId, "intruder") == 0
+
+
+def test_extend_session_ttl_refreshes_every_key_in_few_trips(
+    cache: RedisCache, fake_redis
+):
+    s = Session(userId="userK")
+    m = Message(sessionId=s.sessionId, role="user", content="hi")
+    m.artifacts = [TextArtifact(data="a"), TextArtifact(data="b")]
+    s.messages = [m]
+    cache.save_session(s, cascade=True)
+    upload = TextArtifact(data="file")
+    cache.save_artifact(upload)
+    cache.add_file_artifact_to_session(s.sessionId, upload.artifactId, "userK")
+
+    fake_redis.round_trips.clear()
+    touched = cache.extend_session_ttl(s.sessionId, "userK", ttl=99)
+
+    # Script, message pipeline, artifact pipeline; no SCRIPT EXISTS probe
+    assert [trip[0] for trip in fake_redis.round_trips] == [
+        "evalsha",
+        "expire",
+        "expire",
+    ]
+    assert touched == len(fake_redis._store)
+    assert all(fake_redis._ttls[key] == 99 for key in fake_redis._store)
+
+
+def test_get_session_info_counts(cache: RedisCache):
+    s = Session(userId="userI", title="Info")
+    m1 = Message(
+        sessionId=s.sessionId,
+        role="user",
+        content="hi",
+        artifacts=[TextArtifact(data="a"), TextArtifact(data="b")],
+    )
+    m2 = Message(sessionId=s.sessionId, role="assistant", content="hello")
+    s.messages.extend([m1, m2])
+    cache.save_session(s)
+
+    info = cache.get_session_info(s.sessionId, user_id="userI")
+    assert info is not None
+    assert info.numMessages == 2
+    assert info.numArtifacts == 2
+    assert cache.get_session_info(s.sessionId, user_id="other") is None
+    assert cache.get_session_info("session_missing") is None
+
+
+def test_record_message_in_session(cache: RedisCache):
+    s = Session(userId="userN", title="Count")
+    cache.save_session(s, cascade=False)
+
+    updated = cache.record_message_in_session(s, 1)
+    updated = cache.record_message_in_session(updated, 1, title="Renamed")
+    assert updated.numMessages == 2
+
+    fetched = cache.get_session(s.sessionId)
+    assert fetched.numMessages == 2
+    assert fetched.title == "Renamed"
+    infos = cache.get_sessions_for_user("userN")
+    assert infos[0].numMessages == 2
+
+    assert cache.record_message_in_session(fetched, -1).numMessages == 1
+
+
+def test_record_message_does_not_resurrect_deleted_session(
+    cache: RedisCache, fake_redis
+):
+    s = Session(userId="userR", title="Gone")
+    cache.save_session(s, cascade=False)
+    cache.delete_session(s.sessionId, "userR")
+
+    assert cache.record_message_in_session(s, 1, title="Back") is None
+    assert cache.get_session(s.sessionId) is None
+    assert cache.k_session(s.sessionId) not in fake_redis._store
+    # The user index is not refreshed with the new title either
+    assert all(info.title != "Back" for info in cache.get_sessions_for_user("userR"))
+
+
+def test_session_keys_share_hash_tag(cache: RedisCache):
+    sid = "session_abc"
+    keys = [
+        cache.k_session(sid),
+        cache.k_message_index_by_session(sid),
+        cache.k_file_artifact_index_by_session(sid),
+    ]
+    assert all(k.endswith("{session_abc}") for k in keys)
+
+
+def test_sorted_set_indexes_avoid_legacy_string_keys(cache: RedisCache):
+    """Old JSON-list index keys cannot collide with the sorted-set indexes."""
+    assert cache.k_session_index_by_user("u") != "session_index:user:u"
+    assert cache.k_artifact_index_by_message("m") != "artifact_index:message:m"
+
+
+def test_session_exists(cache: RedisCache):
+    s = Session(userId="userE", title="Exists")
+    cache.save_session(s, cascade=False)
+
+    assert cache.session_exists(s.sessionId)
+    assert cache.session_exists(s.sessionId, "userE")
+    assert not cache.session_exists(s.sessionId, "other")
+    assert not cache.session_exists("session_missing")
+    assert not cache.session_exists("session_missing", "userE")
+
+
+def test_large_artifact_stored_in_parts(cache: RedisCache, fake_redis, monkeypatch):
+    # the storage package re-exports a `redis_cache` instance over the module name
+    redis_cache_module = sys.modules[RedisCache.__module__]
+    monkeypatch.setattr(redis_cache_module, "ARTIFACT_CHUNK_BYTES", 64)
+    art = TextArtifact(data="x" * 500, description="big")
+    cache.save_artifact(art)
+
+    assert cache.k_artifact_part(art.artifactId, 0) in fake_redis._store
+    fetched = cache.get_artifacts([art.artifactId, "artifact_missing"])
+    assert list(fetched) == [art.artifactId]
+    assert fetched[art.artifactId].data == art.data
+    assert cache.get_artifact(art.artifactId).data == art.data
+
+    assert cache.delete_artifact(art.artifactId) > 1
+    assert not any(k.startswith(cache.k_artifact(art.artifactId)) for k in fake_redis._store)
+
+
+def test_resaved_artifact_drops_stale_parts(
+    cache: RedisCache, fake_redis, monkeypatch
+):
+    redis_cache_module = sys.modules[RedisCache.__module__]
+    monkeypatch.setattr(redis_cache_module, "ARTIFACT_CHUNK_BYTES", 64)
+    art = TextArtifact(data="x" * 500)
+    cache.save_artifact(art)
+
+    def part_keys():
+        prefix = cache.k_artifact_part(art.artifactId, 0)[:-1]
+        return {k for k in fake_redis._store if k.startswith(prefix)}
+
+    num_parts = len(part_keys())
+    # Fewer parts: only the ones the new manifest names are left
+    art.data = "x" * 200
+    cache.save_artifact(art)
+    assert 1 < len(part_keys()) < num_parts
+    assert cache.get_artifact(art.artifactId).data == art.data
+    # A single value: no parts at all
+    monkeypatch.setattr(redis_cache_module, "ARTIFACT_CHUNK_BYTES", 1024 * 1024)
+    cache.save_artifact(art)
+    assert part_keys() == set()
+    assert cache.get_artifact(art.artifactId).data == art.data
+
+
+def test_get_message_with_artifacts(cache: RedisCache):
+    s = Session(userId="userM", title="Msg")
+    m = Message(
+        sessionId=s.sessionId,
+        role="user",
+        content="hi",
+        artifacts=[TextArtifact(data="one"), TextArtifact(data="two")],
+    )
+    s.messages.append(m)
+    cache.save_session(s)
+
+    fetched = cache.get_message_with_artifacts(m.messageId, s.sessionId, "userM")
+    assert fetched is not None
+    assert [a.data for a in fetched.artifacts] == ["one", "two"]
+    assert cache.get_message_with_artifacts(m.messageId, s.sessionId, "other") is None
+    assert cache.get_message_with_artifacts(m.messageId, "session_other") is None
+
+
+def test_save_session_cascade_single_pipeline(
+    cache: RedisCache, fake_redis, monkeypatch
+):
+    sess = Session(userId="u1", title="t1")
+    m1 = Message(
+        sessionId=sess.sessionId,
+        role="user",
+        content="a",
+        artifacts=[TextArtifact(data="1"), TextArtifact(data="2")],
+    )
+    sess.messages = [m1]
+
+    executed = []
+    original = fake_redis.pipeline
+
+    def tracking_pipeline(transaction=True):
+        pipe = original(transaction)
+        executed.append(pipe)
+        return pipe
+
+    monkeypatch.setattr(fake_redis, "pipeline", tracking_pipeline)
+    cache.save_session(sess, cascade=True)
+
+    assert len(executed) == 1
+    assert cache.get_artifact_ids_for_message(m1.messageId) == [
+        a.artifactId for a in m1.artifacts
+    ]
+
+    # Re-saving with a cleared field drops it from the hash
+    sess.title = None
+    cache.save_session(sess, cascade=False)
+    assert cache.get_session(sess.sessionId).title is None
+
+
+def test_indexes_are_ordered_and_unique(cache: RedisCache):
+    s1 = Session(userId="userZ", title="older")
+    s2 = Session(userId="userZ", title="newer")
+    cache.save_session(s1)
+    s2.updatedAt = s1.updatedAt.replace(year=s1.updatedAt.year + 1)
+    cache.save_session(s2)
+    assert [i.sessionId for i in cache.get_sessions_for_user("userZ")] == [
+        s2.sessionId,
+        s1.sessionId,
+    ]
+
+    cache._add_artifacts_to_message_index("m1", ["a", "b", "c"])
+    cache._add_artifact_to_message_index("m1", "a")
+    cache._remove_artifact_from_message_index("m1", "b")
+    assert cache.get_artifact_ids_for_message("m1") == ["a", "c"]
+
+    cache.add_file_artifact_to_session(s1.sessionId, "f1")
+    cache.add_file_artifact_to_session(s1.sessionId, "f1")
+    assert cache.get_file_artifact_ids_for_session(s1.sessionId) == ["f1"]
+
+
+def test_legacy_json_values_still_readable(cache: RedisCache, fake_redis):
+    msg = Message(sessionId="session_json", role="user", content="old")
+    fake_redis.setex(cache.k_message(msg.messageId), 60, msg.model_dump_json())
+    assert cache.get_message(msg.messageId).content == "old"
+
+
+def test_msgpack_round_trip(cache: RedisCache, fake_redis):
+    msg = Message(
+        sessionId="session_mp",
+        role="user",
+        content="hi",
+        artifacts=[TextArtifact(data="x")],
+    )
+    cache.save_message(msg)
+    assert fake_redis.get(cache.k_message(msg.messageId))[:1] == b"\x01"
+    assert cache.get_message(msg.messageId) == msg
+    art = msg.artifacts[0]
+    assert cache.get_artifact(art.artifactId) == art
+
+
+def test_delete_paths_check_ownership_once(cache: RedisCache, monkeypatch):
+    s = Session(userId="userD")
+    m = Message(
+        sessionId=s.sessionId,
+        role="user",
+        content="x",
+        artifacts=[TextArtifact(data="1"), TextArtifact(data="2")],
+    )
+    s.messages = [m]
+    cache.save_session(s)
+
+    # A cascade for the wrong owner removes nothing
+    assert cache.delete_session(s.sessionId, user_id="intruder", cascade=True) == 0
+    assert cache.get_message(m.messageId) is not None
+
+    calls = []
+    original = cache.get_message
+    monkeypatch.setattr(
+        cache, "get_message", lambda *a, **kw: calls.append(a) or original(*a, **kw)
+    )
+    assert cache.delete_message(m.messageId, session_id=s.sessionId, cascade=True) > 0
+    assert len(calls) == 1
+    assert all(cache.get_artifact(a.artifactId) is None for a in m.artifacts)
+    assert cache.get_artifact_ids_for_message(m.messageId) is None
+
+
+def test_bulk_getters(cache: RedisCache):
+    s1, s2 = Session(userId="userB"), Session(userId="other")
+    m1 = Message(
+        sessionId=s1.sessionId,
+        role="user",
+        content="a",
+        artifacts=[TextArtifact(data="1")],
+    )
+    m2 = Message(sessionId=s2.sessionId, role="user", content="b")
+    s1.messages, s2.messages = [m1], [m2]
+    cache.save_session(s1)
+    cache.save_session(s2)
+
+    messages = cache.get_messages([m1.messageId, m2.messageId], s1.sessionId)
+    assert [m and m.messageId for m in messages] == [m1.messageId, None]
+
+    assert cache.get_artifact_ids_for_messages([m1.messageId, m2.messageId]) == {
+        m1.messageId: [m1.artifacts[0].artifactId]
+    }
+
+
+def test_binary_artifact_data_packed_as_bytes():
+    payload = bytes(range(256))
+    b64 = base64.b64encode(payload).decode("ascii")
+    dumped = {
+        "messageId": "m",
+        "artifacts": [
+            {"artifactId": "a1", "type": "image", "data": b64},
+            {"artifactId": "a2", "type": "csv", "data": "a,b\n1,2"},
+            {"artifactId": "a3", "type": "text", "data": b64},
+        ],
+    }
+
+    packed = RedisCache._pack_binary_data(copy.deepcopy(dumped))
+    assert [a["data"] for a in packed["artifacts"]] == [payload, "a,b\n1,2", b64]
+    assert RedisCache._unpack_binary_data(packed) == dumped
+
+
+def test_binary_artifact_stored_without_base64(cache: RedisCache, fake_redis):
+    payload = os.urandom(3000)
+    b64 = base64.b64encode(payload).decode("ascii")
+    art = CSVArtifact(data=b64, num_rows=1, num_columns=1)
+    cache.save_artifact(art)
+
+    stored = fake_redis.get(cache.k_artifact(art.artifactId))
+    assert payload in stored
+    assert b64.encode("ascii") not in stored
+    assert len(stored) < len(b64)
+    assert cache.get_artifact(art.artifactId).data == b64
+
+
+def test_num_artifacts_maintained(cache: RedisCache):
+    s = Session(userId="userA")
+    s.messages = [
+        Message(
+            sessionId=s.sessionId,
+            role="user",
+            content="x",
+            artifacts=[TextArtifact(data="1"), TextArtifact(data="2")],
+        )
+    ]
+    cache.save_session(s)
+    assert cache.get_session(s.sessionId).numArtifacts == 2
+
+    updated = cache.record_message_in_session(
+        cache.get_session(s.sessionId), 1, artifacts_delta=3
+    )
+    assert updated.numArtifacts == 5
+    assert cache.get_sessions_for_user("userA")[0].numArtifacts == 5
+
+
+def test_compact_key_schema(fake_redis):
+    compact = RedisCache(redis_client=fake_redis, prefix="p:", compact_keys=True)
+    assert compact.k_artifact("a1") == "p:a:{a1}"
+    assert compact.k_artifact_part("a1", 2) == "p:a:{a1}:p:2"
+    assert compact.k_message_index_by_session("s1") == "p:im:{s1}"
+    assert compact.k_artifact_index_by_message("m1") == "p:ia:m1"
+
+    s = Session(userId="u")
+    s.messages = [Message(sessionId=s.sessionId, role="user", content="x")]
+    compact.save_session(s)
+    assert compact.get_session(s.sessionId, user_id="u") is not None
+    assert compact.get_message_ids_for_session(s.sessionId) == [
+        s.messages[0].messageId
+    ]
+
+
+def test_save_session_indexes_messages_in_one_push(
+    cache: RedisCache, fake_redis, monkeypatch
+):
+    s = Session(userId="userI")
+    s.messages = [
+        Message(sessionId=s.sessionId, role="user", content=str(i)) for i in range(3)
+    ]
+    pushes = []
+    original = fake_redis.rpush
+    monkeypatch.setattr(
+        fake_redis,
+        "rpush",
+        lambda key, *values: pushes.append(values) or original(key, *values),
+    )
+    cache.save_session(s)
+
+    assert len(pushes) == 1
+    assert cache.get_message_ids_for_session(s.sessionId) == [
+        m.messageId for m in s.messages
+    ]
+
+
+def test_get_message_rejects_foreign_session_before_parsing(
+    cache: RedisCache, monkeypatch
+):
+    msg = Message(sessionId="session_owner", role="user", content="x")
+    cache.save_message(msg)
+
+    def fail(*_):
+        raise AssertionError("value should not be parsed")
+
+    monkeypatch.setattr(RedisCache, "_loads", staticmethod(fail))
+    assert cache.get_message(msg.messageId, session_id="session_other") is None
+
+
+def test_none_fields_not_stored(cache: RedisCache, fake_redis):
+    art = TextArtifact(data="x")
+    cache.save_artifact(art)
+    assert b"description" not in fake_redis.get(cache.k_artifact(art.artifactId))
+    assert cache.get_artifact(art.artifactId) == art
+
+
+def test_unchanged_session_not_reindexed(cache: RedisCache, monkeypatch):
+    s = Session(userId="userR", title="same")
+    cache.save_session(s)
+
+    calls = []
+    original = cache._add_session_to_user_index
+    monkeypatch.setattr(
+        cache,
+        "_add_session_to_user_index",
+        lambda *a, **kw: calls.append(a) or original(*a, **kw),
+    )
+    cache.save_session(s)
+    assert calls == []
+
+    s.title = "changed"
+    cache.save_session(s)
+    assert len(calls) == 1
+    assert cache.get_sessions_for_user("userR")[0].title == "changed"
+
+
+def test_large_values_zstd_compressed(cache: RedisCache, fake_redis):
+    msg = Message(sessionId="session_z", role="assistant", content="lorem " * 5000)
+    cache.save_message(msg)
+
+    stored = fake_redis.get(cache.k_message(msg.messageId))
+    assert stored[:1] == b"\x02"
+    assert len(stored) < len(msg.content) // 10
+    assert cache.get_message(msg.messageId, session_id="session_z") == msg
+    assert cache.get_messages([msg.messageId], session_id="session_z") == [msg]
+
+
+def test_writes_queue_on_empty_pipeline(cache: RedisCache, fake_redis):
+    # redis-py pipelines are falsy while empty; the write must still be queued
+    art = TextArtifact(data="queued")
+    pipe = fake_redis.pipeline(transaction=False)
+    assert not pipe
+
+    cache.save_artifact(art, pipe=pipe)
+    assert cache.get_artifact(art.artifactId) is None
+
+    pipe.execute()
+    assert cache.get_artifact(art.artifactId).data == "queued"
+
+
+def test_delete_session_cascade_removes_every_key(cache: RedisCache, fake_redis):
+    s = Session(userId="userW")
+    m = Message(sessionId=s.sessionId, role="user", content="C")
+    m.artifacts = [TextArtifact(data="Z")]
+    s.messages = [m]
+    cache.save_session(s, cascade=True)
+    upload = TextArtifact(data="file")
+    cache.save_artifact(upload)
+    cache.add_file_artifact_to_session(s.sessionId, upload.artifactId, "userW")
+    num_keys = len(fake_redis._store)
+
+    # The user index is emptied by ZREM; everything else goes in the DELs
+    assert cache.delete_session(s.sessionId, "userW", cascade=True) == num_keys - 1
+    assert fake_redis._store == {}
+
+
+def test_cascade_delete_unlinks_in_chunks(cache: RedisCache, fake_redis, monkeypatch):
+    redis_cache_module = sys.modules[RedisCache.__module__]
+    monkeypatch.setattr(redis_cache_module, "UNLINK_CHUNK_KEYS", 2)
+    unlinked = []
+    original = fake_redis.unlink
+
+    def tracking_unlink(*keys):
+        unlinked.append(keys)
+        return original(*keys)
+
+    monkeypatch.setattr(fake_redis, "unlink", tracking_unlink)
+    s = Session(userId="userU")
+    m = Message(sessionId=s.sessionId, role="user", content="C")
+    m.artifacts = [TextArtifact(data=str(i)) for i in range(3)]
+    s.messages = [m]
+    cache.save_session(s, cascade=True)
+
+    # the session's own keys (no file index exists), then the message, its
+    # artifact index and 3 artifacts with their metadata hashes
+    assert cache.delete_session(s.sessionId, "userU", cascade=True) == 11
+    assert [len(keys) for keys in unlinked] == [4, 2, 2, 2, 2]
+
+
+def test_delete_session_checks_owner_in_script(
+    cache: RedisCache, fake_redis, monkeypatch
+):
+    s = Session(userId="userO", title="Mine")
+    s.messages = [Message(sessionId=s.sessionId, role="user", content="hi")]
+    cache.save_session(s, cascade=True)
+
+    hgetall_calls = []
+    original = fake_redis.hgetall
+    monkeypatch.setattr(
+        fake_redis, "hgetall", lambda key: hgetall_calls.append(key) or original(key)
+    )
+
+    assert cache.delete_session(s.sessionId, "intruder", cascade=True) == 0
+    assert cache.get_message_ids_for_session(s.sessionId) == [
+        s.messages[0].messageId
+    ]
+    assert cache.delete_session(s.sessionId, "userO", cascade=True) > 0
+    assert cache.get_session(s.sessionId) is None
+    # The session is never loaded into Python just to check its owner
+    assert hgetall_calls == [cache.k_session(s.sessionId)]
+
+
+def test_save_messages_single_pipeline(cache: RedisCache, fake_redis, monkeypatch):
+    s = Session(userId="userB")
+    cache.save_session(s)
+    messages = [
+        Message(sessionId=s.sessionId, role="user", content="q"),
+        Message(
+            sessionId="other",
+            role="assistant",
+            content="a",
+            artifacts=[TextArtifact(data="x")],
+        ),
+    ]
+    executed = []
+    original = fake_redis.pipeline
+
+    def tracking_pipeline(transaction=True):
+        pipe = original(transaction)
+        executed.append(pipe)
+        return pipe
+
+    monkeypatch.setattr(fake_redis, "pipeline", tracking_pipeline)
+    cache.save_messages(s.sessionId, messages)
+
+    assert len(executed) == 1
+    assert messages[1].sessionId == s.sessionId
+    assert cache.get_message_ids_for_session(s.sessionId) == [
+        m.messageId for m in messages
+    ]
+    assert cache.get_artifact_ids_for_message(messages[1].messageId) == [
+        messages[1].artifacts[0].artifactId
+    ]
+
+
+def test_artifact_metadata_read_without_payload(
+    cache: RedisCache, fake_redis, monkeypatch
+):
+    s = Session(userId="userM")
+    cache.save_session(s)
+    csv = CSVArtifact(
+        data="YSxiCjEsMgo=", num_rows=1, num_columns=2, columns=["a", "b"]
+    )
+    image = ImageArtifact(data="x" * 4096, width=8, height=4, thumbnail_data="t")
+    for art in (image, csv):
+        cache.save_artifact(art)
+        cache.add_file_artifact_to_session(s.sessionId, art.artifactId, "userM")
+
+    meta = cache.get_artifacts_metadata([image.artifactId, csv.artifactId, "nope"])
+    assert meta[csv.artifactId]["columns"] == ["a", "b"]
+    assert meta[csv.artifactId]["num_rows"] == 1
+    assert meta[image.artifactId]["width"] == 8
+    assert "data" not in meta[image.artifactId]
+    assert "thumbnail_data" not in meta[image.artifactId]
+    assert "nope" not in meta
+
+    # A field cleared on re-save is gone from the metadata too
+    csv.columns = None
+    cache.save_artifact(csv)
+    assert "columns" not in cache.get_artifacts_metadata([csv.artifactId])[
+        csv.artifactId
+    ]
+
+    # Finding the session's CSV does not read the image payload
+    fetched = []
+    original = fake_redis.mget
+    monkeypatch.setattr(
+        fake_redis, "mget", lambda keys: fetched.extend(keys) or original(keys)
+    )
+    assert cache.get_session_csv_artifact(s.sessionId, "userM").artifactId == (
+        csv.artifactId
+    )
+    assert fetched == [cache.k_artifact(csv.artifactId)]
+
+
+def test_batch_artifact_read_decompresses_in_parallel(cache: RedisCache, monkeypatch):
+    redis_cache_module = sys.modules[RedisCache.__module__]
+    monkeypatch.setattr(redis_cache_module, "PARALLEL_DECOMPRESS_MIN_BYTES", 0)
+    monkeypatch.setattr(redis_cache_module, "PARALLEL_DECOMPRESS_THREADS", 4)
+    arts = [TextArtifact(data=f"{i} " + "lorem " * 2000) for i in range(3)]
+    small = TextArtifact(data="tiny")
+    for art in arts + [small]:
+        cache.save_artifact(art)
+
+    ids = [a.artifactId for a in arts] + [small.artifactId]
+    found = cache.get_artifacts(ids)
+    assert [found[aid].data for aid in ids] == [a.data for a in arts + [small]]
+
+
+def test_artifact_counter_follows_indexed_artifacts(cache: RedisCache):
+    from app.services.chat.message_service import MessageService
+
+    s = Session(userId="userA")
+    cache.save_session(s, cascade=False)
+    service = MessageService(cache=cache)
+
+    unsaved = Message(
+        sessionId=s.sessionId,
+        role="user",
+        content="q",
+        artifacts=[TextArtifact(data="x")],
+    )
+    asyncio.run(
+        service.push_message(
+            s.sessionId, "userA", unsaved, push_artifacts_in_message=False
+        )
+    )
+    assert cache.get_session_info(s.sessionId).numArtifacts == 0
+
+    arts = [TextArtifact(data="a"), TextArtifact(data="b"), TextArtifact(data="c")]
+    saved = Message(sessionId=s.sessionId, role="assistant", content="r")
+    saved.artifacts = list(arts)
+    asyncio.run(service.push_message(s.sessionId, "userA", saved))
+    info = cache.get_session_info(s.sessionId, user_id="userA")
+    assert (info.numMessages, info.numArtifacts) == (2, 3)
+
+    upload = TextArtifact(data="file")
+    cache.save_artifact(upload)
+    cache.add_file_artifact_to_session(s.sessionId, upload.artifactId, "userA")
+
+    # Every delete path for a message artifact takes it off the counter
+    cache.delete_artifact(arts[0].artifactId, message_id=saved.messageId)
+    cache.delete_artifact_with_ownership(
+        arts[1].artifactId, saved.messageId, s.sessionId, "userA"
+    )
+    # Uploads were never counted
+    cache.delete_file_artifact_with_ownership(upload.artifactId, s.sessionId, "userA")
+    assert cache.get_session_info(s.sessionId).numArtifacts == 1
+    assert cache.get_sessions_for_user("userA")[0].numArtifacts == 1
+
+    # Adding an artifact counts it once, however often it is re-added
+    extra = TextArtifact(data="d")
+    for _ in range(2):
+        assert asyncio.run(
+            service.add_artifact_to_message(saved.messageId, s.sessionId, "userA", extra)
+        )
+    assert cache.get_session_info(s.sessionId).numArtifacts == 2
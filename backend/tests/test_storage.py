@@ -2,9 +2,12 @@
 
 import pytest
 import pandas as pd
-from PIL import Image
+from PIL import Image, ImageFile
 import io
+import sys
 import base64
+import time
+import uuid
 from typing import Optional
 
 from app.services.storage.storage import (
@@ -15,9 +18,14 @@ from app.services.storage.storage import (
 from app.services.storage.redis_cache import RedisCache
 from app.models.object_models import CSVArtifact, ImageArtifact, TextArtifact
 from app.services.storage.files_handler import (
+    DataFrameHandler,
+    ImageHandler,
     compress_data,
     convert_df_to_parquet_bytes,
     encode_bytes_to_base64,
+    gunzip_from_base64,
+    gzip_to_base64,
+    read_csv_to_table,
 )
 
 
@@ -27,10 +35,10 @@ def mock_cache(fake_redis):
     return RedisCache(redis_client=fake_redis, prefix="test:storage:", ttl_seconds=3600)
 
 
-def test_push_csv_artifact_from_dataframe(mock_cache):
-    """Test creating and storing a CSV artifact from a pandas DataFrame."""
-    # Create a test DataFrame
-    df = pd.DataFrame(
+@pytest.fixture(scope="module")
+def sample_df():
+    """A small DataFrame shared by the CSV tests; none of them mutate it."""
+    return pd.DataFrame(
         {
             "name": ["Alice", "Bob", "Charlie"],
             "age": [25, 30, 35],
@@ -38,12 +46,18 @@ def test_push_csv_artifact_from_dataframe(mock_cache):
         }
     )
 
+
+def test_push_csv_artifact_from_dataframe(mock_cache, sample_df):
+    """Test creating and storing a CSV artifact from a pandas DataFrame."""
     message_id = "test_message_123"
     description = "Test CSV data"
 
     # Push to cache
     artifact = push_csv_artifact_to_redis(
-        df=df, cache=mock_cache, message_id=message_id, description=description
+        df=sample_df,
+        cache=mock_cache,
+        message_id=message_id,
+        description=description,
     )
 
     # Verify artifact properties
@@ -67,16 +81,9 @@ def test_push_csv_artifact_from_dataframe(mock_cache):
     assert artifact.artifactId in artifact_ids
 
 
-def test_push_csv_artifact_from_csv_string(mock_cache):
+def test_push_csv_artifact_from_csv_string(mock_cache, sample_df):
     """Test creating and storing a CSV artifact from a CSV string."""
-    df = pd.DataFrame(
-        {
-            "name": ["Alice", "Bob", "Charlie"],
-            "age": [25, 30, 35],
-            "city": ["New York", "London", "Tokyo"],
-        }
-    )
-    bytes_ = convert_df_to_parquet_bytes(df)  # convert to bytes
+    bytes_ = convert_df_to_parquet_bytes(sample_df)  # convert to bytes
     bytes_ = compress_data(bytes_, compression="gzip")  # compress the bytes
 
     csv_string = encode_bytes_to_base64(bytes_)
@@ -95,16 +102,9 @@ def test_push_csv_artifact_from_csv_string(mock_cache):
     assert artifact.num_columns == 3
 
 
-def test_push_csv_artifact_from_bytes(mock_cache):
+def test_push_csv_artifact_from_bytes(mock_cache, sample_df):
     """Test creating and storing a CSV artifact from bytes."""
-    df = pd.DataFrame(
-        {
-            "name": ["Alice", "Bob", "Charlie"],
-            "age": [25, 30, 35],
-            "city": ["New York", "London", "Tokyo"],
-        }
-    )
-    csv_bytes = convert_df_to_parquet_bytes(df)  # convert to bytes
+    csv_bytes = convert_df_to_parquet_bytes(sample_df)  # convert to bytes
     csv_bytes = compress_data(csv_bytes, compression="gzip")  # compress the bytes
 
     artifact = push_csv_artifact_to_redis(
@@ -157,6 +157,8 @@ def test_push_image_artifact_from_pil(mock_cache):
     assert artifact.format == "png"  # Default format
     assert artifact.data is not None
     assert artifact.thumbnail_data is not None
+    # Already thumbnail-sized, so the full encoding doubles as the thumbnail
+    assert artifact.thumbnail_data == artifact.data
 
     # Verify artifact was stored and indexed
     stored_artifact = mock_cache.get_artifact(
@@ -192,6 +194,185 @@ def test_push_image_artifact_from_bytes(mock_cache):
     assert artifact.format == "png"
 
 
+def test_push_jpeg_artifact_thumbnail_uses_draft(mock_cache):
+    """JPEG thumbnails are decoded at reduced scale and still fit the box."""
+    img = Image.new("RGB", (1600, 800), color="green")
+    img_bytes = io.BytesIO()
+    img.save(img_bytes, format="JPEG")
+
+    artifact = push_image_artifact_to_redis(
+        image=img_bytes.getvalue(), cache=mock_cache
+    )
+
+    assert artifact.width == 1600
+    assert artifact.height == 800
+    assert artifact.format == "webp"
+    thumbnail = Image.open(io.BytesIO(base64.b64decode(artifact.thumbnail_data)))
+    assert thumbnail.size == (128, 64)
+
+
+def test_push_jpeg_artifact_lossless_keeps_png(mock_cache):
+    """lossless=True stores photos as PNG instead of WebP."""
+    img = Image.new("RGB", (40, 20), color="green")
+    img_bytes = io.BytesIO()
+    img.save(img_bytes, format="JPEG")
+
+    artifact = push_image_artifact_to_redis(
+        image=img_bytes.getvalue(), cache=mock_cache, lossless=True
+    )
+
+    assert artifact.format == "png"
+    assert Image.open(io.BytesIO(base64.b64decode(artifact.data))).format == "PNG"
+
+
+def test_push_png_bytes_stored_without_reencoding(mock_cache):
+    """PNG input is already in the storage format, so its bytes are kept as-is."""
+    img = Image.new("RGBA", (300, 200), color=(0, 0, 255, 128))
+    img_bytes = io.BytesIO()
+    img.save(img_bytes, format="PNG", compress_level=1)
+    img_bytes = img_bytes.getvalue()
+
+    artifact = push_image_artifact_to_redis(image=img_bytes, cache=mock_cache)
+
+    assert artifact.format == "png"
+    assert base64.b64decode(artifact.data) == img_bytes
+
+
+def test_image_pixels_decoded_once(mock_cache, monkeypatch):
+    """The handler decodes up front; pass-through storage does not decode again."""
+    img = Image.new("RGB", (100, 80), color="purple")
+    buffer = io.BytesIO()
+    img.save(buffer, format="PNG")
+    loads = []
+    original_load = ImageFile.ImageFile.load
+    monkeypatch.setattr(
+        ImageFile.ImageFile,
+        "load",
+        lambda self: loads.append(self.format) or original_load(self),
+    )
+
+    artifact = push_image_artifact_to_redis(image=buffer.getvalue(), cache=mock_cache)
+
+    assert (artifact.width, artifact.height) == (100, 80)
+    assert artifact.thumbnail_data == artifact.data
+    assert loads == ["PNG"]
+
+
+def test_corrupt_image_rejected_up_front():
+    """Damaged image data fails in the handler, not in a later save()."""
+    buffer = io.BytesIO()
+    Image.new("RGB", (64, 64), color="red").save(buffer, format="PNG")
+    data = bytearray(buffer.getvalue())
+    data[data.index(b"IDAT") + 8] ^= 0xFF  # the pixel data stream is now broken
+
+    with pytest.raises(OSError):
+        ImageHandler(data=bytes(data), encoding=None)
+
+
+def test_truncated_jpeg_rejected_up_front():
+    """A cut-off JPEG is rejected before its bytes can be stored as-is."""
+    buffer = io.BytesIO()
+    Image.effect_noise((100, 100), 50).convert("RGB").save(buffer, format="JPEG")
+    data = buffer.getvalue()
+
+    with pytest.raises(OSError):
+        ImageHandler(data=data[: len(data) * 4 // 5], encoding=None, image_format="jpeg")
+
+
+def test_vips_thumbnail_options_and_pillow_fallback(monkeypatch):
+    """libvips gets the source bytes without auto-rotation; errors fall back."""
+    img = Image.new("RGB", (400, 200), color="olive")
+    buffer = io.BytesIO()
+    img.save(buffer, format="PNG")
+    calls = []
+
+    class FakeVipsError(Exception):
+        pass
+
+    class FakeThumbnail:
+        def write_to_buffer(self, suffix, **options):
+            calls.append((suffix, options))
+            return b"vips-thumbnail"
+
+    class FakeVipsImage:
+        @staticmethod
+        def thumbnail_buffer(data, width, **kwargs):
+            calls.append((data, width, kwargs))
+            return FakeThumbnail()
+
+    fake_pyvips = type("pyvips", (), {"Image": FakeVipsImage, "Error": FakeVipsError})
+    files_handler = sys.modules[ImageHandler.__module__]
+    monkeypatch.setattr(files_handler, "pyvips", fake_pyvips)
+
+    handler = ImageHandler(data=buffer.getvalue(), encoding=None)
+    assert handler.get_thumbnail_bytes(size=(128, 128)) == b"vips-thumbnail"
+    assert calls[0] == (
+        buffer.getvalue(),
+        128,
+        {"height": 128, "size": "down", "no_rotate": True},
+    )
+    assert calls[1] == (".png", {})
+
+    def failing(data, width, **kwargs):
+        raise FakeVipsError("unsupported")
+
+    monkeypatch.setattr(FakeVipsImage, "thumbnail_buffer", staticmethod(failing))
+    thumbnail = Image.open(io.BytesIO(handler.get_thumbnail_bytes(size=(128, 128))))
+    assert thumbnail.size == (128, 64)
+
+
+def test_thumbnail_orientation_matches_stored_image():
+    """A JPEG with an EXIF rotation keeps the stored image's orientation."""
+    img = Image.new("RGB", (400, 200), color="teal")
+    exif = Image.Exif()
+    exif[0x0112] = 6  # rotate 90 degrees on display
+    buffer = io.BytesIO()
+    img.save(buffer, format="JPEG", exif=exif.tobytes())
+
+    handler = ImageHandler(data=buffer.getvalue(), encoding=None)
+    handler.image_format = "webp"
+    full = Image.open(io.BytesIO(handler.get_raw_bytes()))
+    thumbnail = Image.open(io.BytesIO(handler.get_thumbnail_bytes(size=(128, 128))))
+    assert full.size == (400, 200)
+    assert thumbnail.size == (128, 64)
+
+
+def test_push_png_base64_string_reused_as_payload(mock_cache):
+    """A canonical base64 PNG is stored without decode/re-encode of the string."""
+    img = Image.new("RGB", (300, 200), color="green")
+    img_bytes = io.BytesIO()
+    img.save(img_bytes, format="PNG")
+    b64 = base64.b64encode(img_bytes.getvalue()).decode()
+
+    handler = ImageHandler(data=b64)
+    assert handler.get_base64_representation() is b64
+
+    artifact = push_image_artifact_to_redis(image=b64, cache=mock_cache)
+    assert artifact.data == b64
+    assert (artifact.width, artifact.height) == (300, 200)
+
+    # Whitespace is dropped by the decoder, so such input is re-encoded
+    wrapped = b64[:76] + "\n" + b64[76:]
+    assert ImageHandler(data=wrapped).get_base64_representation() == b64
+
+
+def test_push_image_artifact_from_uncompressed_bytes_with_gzip(mock_cache):
+    """PNG bytes stored without a gzip layer still load when gzip is declared."""
+    img = Image.new("RGB", (30, 15), color="red")
+    img_bytes = io.BytesIO()
+    img.save(img_bytes, format="PNG")
+
+    artifact = push_image_artifact_to_redis(
+        image=img_bytes.getvalue(),
+        cache=mock_cache,
+        description="Red image without gzip",
+        compression="gzip",
+    )
+
+    assert artifact.width == 30
+    assert artifact.height == 15
+
+
 def test_push_image_artifact_from_base64_string(mock_cache):
     """Test creating and storing an Image artifact from base64 string."""
     # Create a small image and convert to base64
@@ -363,3 +544,97 @@ def test_artifact_ids_uniqueness(mock_cache):
     # Verify all IDs are unique
     artifact_ids = [a.artifactId for a in artifacts]
     assert len(artifact_ids) == len(set(artifact_ids))
+
+
+def test_ids_are_time_ordered_uuid7():
+    """Generated IDs are UUIDv7, so later IDs sort after earlier ones."""
+    first = TextArtifact(data="a").artifactId
+    time.sleep(0.002)
+    second = TextArtifact(data="b").artifactId
+
+    assert first.startswith("artifact_")
+    assert uuid.UUID(first.removeprefix("artifact_")).version == 7
+    assert first < second
+
+
+def test_gunzip_from_base64_round_trip():
+    """Streaming base64+gunzip decode inverts gzip_to_base64."""
+    payload = b"col_a,col_b\n" + b"1,2\n" * 100_000
+
+    assert gunzip_from_base64(gzip_to_base64(payload)) == payload
+    # Non-gzip payloads come back base64-decoded only
+    assert gunzip_from_base64(encode_bytes_to_base64(b"PAR1")) == b"PAR1"
+
+
+def test_push_large_text_artifact_compressed(mock_cache):
+    """Large text artifacts are stored compressed and read back unchanged."""
+    text = "log line with some repeated content\n" * 200
+    artifact = push_text_artifact_to_redis(text=text, cache=mock_cache)
+
+    stored = mock_cache.redis.get(mock_cache.k_artifact(artifact.artifactId))
+    assert len(stored) < len(text) // 4
+    assert mock_cache.get_artifact(artifact.artifactId).data == text
+
+
+def test_csv_table_encoded_without_pandas():
+    """An Arrow-parsed CSV is stored as parquet; pandas is built only on demand."""
+    table = read_csv_to_table(b"1;x\n2;y\n", delimiter=";", header=False)
+    assert table.column_names == ["0", "1"]
+
+    handler = DataFrameHandler(table)
+    payload = handler.get_base64_representation()
+    assert handler._df is None
+
+    df = DataFrameHandler(payload).get_python_friendly_format()
+    assert df["0"].tolist() == [1, 2]
+    assert df["1"].tolist() == ["x", "y"]
+    assert handler.get_python_friendly_format().shape == (2, 2)
+
+
+def test_push_csv_artifact_from_table_reads_shape_from_arrow(mock_cache):
+    """Row and column counts are read straight from an Arrow table."""
+    table = read_csv_to_table(b"a,b,c\n1,2,3\n4,5,6\n7,8,9\n")
+
+    artifact = push_csv_artifact_to_redis(df=table, cache=mock_cache)
+
+    assert (artifact.num_rows, artifact.num_columns) == (3, 3)
+    assert DataFrameHandler(table).columns == ["a", "b", "c"]
+
+
+def test_parquet_input_shape_from_footer_and_bytes_kept():
+    """Parquet input is measured from its footer and stored without re-encoding."""
+    df = pd.DataFrame({"a": [1, 2, 3], "b": ["x", "y", "z"]}, index=[7, 8, 9])
+    parquet = convert_df_to_parquet_bytes(df)
+
+    handler = DataFrameHandler(parquet, encoding=None, compression=None)
+    # The stored index column is not counted
+    assert handler.shape == (3, 2)
+    assert handler.columns == ["a", "b"]
+    assert handler.get_raw_bytes() == parquet
+    assert handler.df.index.tolist() == [7, 8, 9]
+
+
+def test_zstd_csv_payload_round_trip_and_reads_gzip():
+    """zstd-compressed CSV payloads round-trip, and gzip ones still decode."""
+    df = pd.DataFrame({"a": range(50), "b": ["x"] * 50})
+    handler = DataFrameHandler(df, file_format="csv", compression="zstd")
+    payload = handler.get_raw_bytes()
+    assert payload[:4] == b"\x28\xb5\x2f\xfd"
+    restored = DataFrameHandler(payload, file_format="csv", compression="zstd")
+    assert restored.df["b"].tolist() == df["b"].tolist()
+
+    legacy = DataFrameHandler(df, file_format="csv", compression="gzip")
+    restored = DataFrameHandler(
+        legacy.get_base64_representation(), file_format="csv", compression="zstd"
+    )
+    assert restored.df["a"].tolist() == df["a"].tolist()
+
+
+def test_zstd_frames_decoded_with_and_without_declared_size():
+    """One-shot decode uses the header's size; concatenated frames still work."""
+    files_handler = sys.modules[ImageHandler.__module__]
+    first = files_handler.compress_zstd(b"x" * 1000)
+    second = files_handler.compress_zstd(b"y" * 300)
+    assert files_handler._zstd_content_size(first) == 1000
+    assert files_handler.decompress_zstd(first) == b"x" * 1000
+    assert files_handler.decompress_zstd(first + second) == b"x" * 1000 + b"y" * 300